@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,23 +14,24 @@ if TYPE_CHECKING:
 log = logging.getLogger("faithful.backends")
 
 # Map of backend names to (module_path, class_name, required_package)
-_BACKEND_REGISTRY: dict[str, tuple[str, str, str]] = {
+_BACKEND_REGISTRY: Mapping[str, tuple[str, str, str]] = MappingProxyType({
     "openai": ("faithful.backends.openai", "OpenAIBackend", "openai"),
     "openai-compatible": ("faithful.backends.openai_compat", "OpenAICompatibleBackend", "openai"),
     "gemini": ("faithful.backends.gemini", "GeminiBackend", "google.genai"),
     "anthropic": ("faithful.backends.anthropic", "AnthropicBackend", "anthropic"),
-}
+})
 
 BACKEND_NAMES = list(_BACKEND_REGISTRY.keys())
 
 
-def get_backend(name: str, config: Config) -> Backend:
-    """Instantiate and return a backend by name.
+@functools.lru_cache(maxsize=None)
+def _load_backend_class(name: str) -> type[Backend]:
+    """Import the backend module for *name* and return its class.
 
-    Backend SDK dependencies are imported lazily — only the active backend's
-    package needs to be installed. A clear error is raised if it's missing.
+    Memoized so repeated lookups skip the import machinery. Failed imports
+    raise and are therefore not cached.
     """
-    entry = _BACKEND_REGISTRY.get(name.lower())
+    entry = _BACKEND_REGISTRY.get(name)
     if entry is None:
         raise ValueError(
             f"Unknown backend '{name}'. Choose from: {', '.join(_BACKEND_REGISTRY)}"
@@ -34,14 +39,20 @@ def get_backend(name: str, config: Config) -> Backend:
 
     module_path, class_name, package = entry
     try:
-        import importlib
         module = importlib.import_module(module_path)
-        cls = getattr(module, class_name)
     except ImportError as e:
         raise ImportError(
             f"Backend '{name}' requires the '{package}' package. "
             f"Install it with: pip install {package}\n"
             f"Original error: {e}"
         ) from e
+    return getattr(module, class_name)
+
 
-    return cls(config)
+def get_backend(name: str, config: Config) -> Backend:
+    """Instantiate and return a backend by name.
+
+    Backend SDK dependencies are imported lazily — only the active backend's
+    package needs to be installed. A clear error is raised if it's missing.
+    """
+    return _load_backend_class(name.lower())(config)
@@ -1,18 +1,49 @@
 from __future__ import annotations
 
+import functools
+import logging
+from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
 import anthropic
+import httpx
 
 from .base import Attachment, Backend, SPONTANEOUS_PROMPT, ToolCall
 
 if TYPE_CHECKING:
     from faithful.config import Config
 
+log = logging.getLogger("faithful.llm")
+
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 MAX_PAUSE_TURNS = 10
 
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# The SDK default drops idle connections after 5s, which for a chat bot means
+# nearly every reply pays a fresh TLS handshake. Keep them around for a minute.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=500,
+    max_keepalive_connections=100,
+    keepalive_expiry=60,
+)
+
+# The SDK retries 429, 5xx, and connection errors with jittered exponential
+# backoff and honours retry-after; its default of 2 attempts gives up too
+# early when a burst of channels hits the rate limit together.
+_MAX_RETRIES = 5
+
+
+@functools.lru_cache(maxsize=8)
+def _make_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return a shared client per API key so its connection pool survives backend re-creation."""
+    return anthropic.AsyncAnthropic(
+        api_key=api_key,
+        max_retries=_MAX_RETRIES,
+        http_client=anthropic.DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
+    )
+
 
 class AnthropicBackend(Backend):
     """Generates text via the Anthropic Messages API."""
@@ -22,7 +53,10 @@ class AnthropicBackend(Backend):
 
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        self._client = anthropic.AsyncAnthropic(api_key=config.backend.api_key)
+        self._client = _make_client(config.backend.api_key)
+        # Config is read-only at runtime, so the per-request constants are
+        # resolved once here instead of on every call.
+        self._static_kwargs = self._build_static_kwargs()
 
     @staticmethod
     def _normalize_messages(
@@ -33,6 +67,18 @@ class AnthropicBackend(Backend):
         Messages with list content (compacted blocks, tool blocks) are passed
         through unchanged — they must not be string-concatenated.
         """
+        # Fast path: history we built ourselves usually already alternates.
+        # Still hand back a new list -- callers append/replace entries in it.
+        prev_role = "assistant"
+        for msg in messages:
+            role = msg.get("role")
+            if role == prev_role or role not in ("user", "assistant") or "tool_calls" in msg:
+                break
+            prev_role = role
+        else:
+            if messages:
+                return list(messages)
+
         start = 0
         for i, msg in enumerate(messages):
             if msg["role"] != "assistant":
@@ -41,38 +87,62 @@ class AnthropicBackend(Backend):
         else:
             return [{"role": "user", "content": SPONTANEOUS_PROMPT}]
 
-        merged: list[dict[str, Any]] = []
-        for msg in messages[start:]:
-            # Skip provider-agnostic tool round entries from session history;
-            # the tool loop builds Anthropic-specific format via _append_tool_result
-            if msg.get("role") == "tool_results" or "tool_calls" in msg:
-                continue
-
-            if merged and merged[-1]["role"] == msg["role"]:
-                prev_content = merged[-1]["content"]
-                curr_content = msg.get("content", "")
+        # Skip provider-agnostic tool round entries from session history;
+        # the tool loop builds Anthropic-specific format via _append_tool_result
+        filtered = (
+            msg for msg in messages[start:]
+            if msg.get("role") != "tool_results" and "tool_calls" not in msg
+        )
 
-                # Only merge plain strings; lists (compacted/tool blocks) pass through
-                if isinstance(prev_content, str) and isinstance(curr_content, str):
-                    merged[-1] = {
-                        "role": msg["role"],
-                        "content": prev_content + "\n" + curr_content,
-                    }
-                else:
-                    merged.append(dict(msg))
+        merged: list[dict[str, Any]] = []
+        for (role, is_text), run in groupby(
+            filtered, key=lambda m: (m["role"], isinstance(m.get("content", ""), str))
+        ):
+            group = list(run)
+            if is_text and len(group) > 1:
+                # One join per run instead of re-concatenating per message
+                merged.append({
+                    "role": role,
+                    "content": "\n".join(m.get("content", "") for m in group),
+                })
             else:
-                merged.append(dict(msg))
+                # Only merge plain strings; lists (compacted/tool blocks) pass through
+                merged.extend(dict(m) for m in group)
 
         return merged or [{"role": "user", "content": SPONTANEOUS_PROMPT}]
 
     @staticmethod
-    def _extract_text(content: list[Any]) -> str:
-        """Extract text from response content blocks, skipping server tool blocks."""
+    def _partition_content(content: list[Any]) -> tuple[str, list[ToolCall]]:
+        """Split response blocks into joined text and client-side tool calls.
+
+        One pass over the blocks; server tool blocks, thinking, and compaction
+        blocks are skipped.
+        """
         parts: list[str] = []
+        tool_calls: list[ToolCall] = []
         for block in content:
-            if getattr(block, "type", None) == "text" and hasattr(block, "text"):
-                parts.append(block.text)
-        return "\n".join(parts).strip()
+            # The content union holds many block shapes (thinking, server-tool
+            # results, compaction, etc.) that don't carry text/id/name/input —
+            # pull those fields via getattr so pyright doesn't see attribute
+            # access on the wrong side of the union.
+            block_type = getattr(block, "type", None)
+            if block_type == "text":
+                text = getattr(block, "text", None)
+                if text is not None:
+                    parts.append(text)
+            elif block_type == "tool_use":
+                # Only client-side tool_use, not server_tool_use
+                block_id = getattr(block, "id", None)
+                block_name = getattr(block, "name", None)
+                if not block_id or not block_name:
+                    continue
+                block_input = getattr(block, "input", None)
+                tool_calls.append(ToolCall(
+                    id=block_id,
+                    name=block_name,
+                    arguments=block_input if isinstance(block_input, dict) else {},
+                ))
+        return "\n".join(parts).strip(), tool_calls
 
     def _track_message_usage(self, message: Any) -> None:
         """Extract and track token usage from an Anthropic response."""
@@ -82,6 +152,37 @@ class AnthropicBackend(Backend):
                 getattr(usage, "input_tokens", 0),
                 getattr(usage, "output_tokens", 0),
             )
+            log.debug(
+                "Prompt cache: %s read / %s written",
+                getattr(usage, "cache_read_input_tokens", 0),
+                getattr(usage, "cache_creation_input_tokens", 0),
+            )
+
+    @staticmethod
+    def _with_cache_breakpoint(
+        messages: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return *messages* with a cache breakpoint on the final content block.
+
+        Marking the newest turn lets the next tool round or reply reuse the
+        whole conversation prefix. Only the last message is marked -- the
+        system prompt and tool list hold two of the four allowed breakpoints.
+        The marked message is copied; shared content blocks stay untouched.
+        """
+        if not messages:
+            return messages
+        last = messages[-1]
+        content = last.get("content")
+        if isinstance(content, str):
+            if not content:
+                return messages
+            blocks: list[Any] = [{"type": "text", "text": content, "cache_control": _CACHE_CONTROL}]
+        elif isinstance(content, list) and content and isinstance(content[-1], dict):
+            blocks = [*content[:-1], {**content[-1], "cache_control": _CACHE_CONTROL}]
+        else:
+            # Raw SDK blocks (pause_turn continuations) can't be tagged
+            return messages
+        return [*messages[:-1], {**last, "content": blocks}]
 
     def _apply_attachments(
         self,
@@ -94,13 +195,12 @@ class AnthropicBackend(Backend):
         text = last["content"] if isinstance(last["content"], str) else ""
         content: list[dict[str, Any]] = []
         for att in attachments:
-            b64 = att.b64
             content.append({
                 "type": "image",
                 "source": {
                     "type": "base64",
                     "media_type": att.media_type,
-                    "data": b64,
+                    "data": att.b64,
                 },
             })
         content.append({"type": "text", "text": text})
@@ -131,26 +231,13 @@ class AnthropicBackend(Backend):
             betas.append("compact-2026-01-12")
         return betas
 
-    def _build_kwargs(
-        self,
-        system_prompt: str,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-    ) -> dict[str, Any]:
-        """Build kwargs dict shared by _call_api and _call_with_tools."""
+    def _build_static_kwargs(self) -> dict[str, Any]:
+        """Build the request kwargs that depend only on config."""
         kwargs: dict[str, Any] = {
             "model": self.config.backend.model or DEFAULT_MODEL,
             "max_tokens": self.config.llm.max_tokens,
             "temperature": self.config.llm.temperature,
-            "system": [{
-                "type": "text",
-                "text": system_prompt,
-                "cache_control": {"type": "ephemeral"},
-            }],
-            "messages": messages,
         }
-        if tools:
-            kwargs["tools"] = tools
         if self.config.backend.enable_thinking:
             kwargs["thinking"] = {"type": "adaptive"}
         if self.config.backend.enable_compaction:
@@ -162,18 +249,38 @@ class AnthropicBackend(Backend):
             kwargs["betas"] = betas
         return kwargs
 
-    async def _call_api(
+    def _build_kwargs(
         self,
         system_prompt: str,
-        messages: list[dict[str, str]],
-        attachments: list[Attachment] | None = None,
-    ) -> str:
-        normalized = self._normalize_messages(messages)
-        normalized = self._apply_attachments(normalized, attachments)
-
-        tools = self._native_server_tools() + self._native_memory_tool()
-        kwargs = self._build_kwargs(system_prompt, normalized, tools or None)
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Build kwargs dict shared by _call_api and _call_with_tools."""
+        kwargs: dict[str, Any] = {
+            **self._static_kwargs,
+            "system": [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": _CACHE_CONTROL,
+            }],
+            "messages": self._with_cache_breakpoint(messages),
+        }
+        if tools:
+            # A breakpoint on the last tool caches the whole tool schema block
+            kwargs["tools"] = [*tools[:-1], {**tools[-1], "cache_control": _CACHE_CONTROL}]
+        return kwargs
 
+    async def _create_message(
+        self,
+        kwargs: dict[str, Any],
+        normalized: list[dict[str, Any]],
+    ) -> Any:
+        """Stream one response, resuming server-side tool loops on pause_turn."""
+        # Streaming keeps large max_tokens requests clear of the SDK's
+        # non-streaming timeout guard, and a cancelled debounce task exits the
+        # context manager, which aborts generation server-side instead of
+        # paying for tokens nobody will see. Text is still delivered whole:
+        # one yield from generate() is one Discord message.
         async with self._client.beta.messages.stream(**kwargs) as stream:
             message = await stream.get_final_message()
         self._track_message_usage(message)
@@ -183,12 +290,28 @@ class AnthropicBackend(Backend):
             if message.stop_reason != "pause_turn":
                 break
             normalized.append({"role": "assistant", "content": message.content})
-            kwargs["messages"] = normalized
+            kwargs["messages"] = self._with_cache_breakpoint(normalized)
             async with self._client.beta.messages.stream(**kwargs) as stream:
                 message = await stream.get_final_message()
             self._track_message_usage(message)
 
-        return self._extract_text(message.content)
+        return message
+
+    async def _call_api(
+        self,
+        system_prompt: str,
+        messages: list[dict[str, str]],
+        attachments: list[Attachment] | None = None,
+    ) -> str:
+        normalized = self._normalize_messages(messages)
+        normalized = self._apply_attachments(normalized, attachments)
+
+        tools = self._native_server_tools() + self._native_memory_tool()
+        kwargs = self._build_kwargs(system_prompt, normalized, tools or None)
+
+        message = await self._create_message(kwargs, normalized)
+        text, _ = self._partition_content(message.content)
+        return text
 
     # ── Tool support ─────────────────────────────────────
 
@@ -214,43 +337,9 @@ class AnthropicBackend(Backend):
 
         kwargs = self._build_kwargs(system_prompt, normalized, tools)
 
-        async with self._client.beta.messages.stream(**kwargs) as stream:
-            message = await stream.get_final_message()
-        self._track_message_usage(message)
-
-        # Handle pause_turn for server-side tool loops
-        for _ in range(MAX_PAUSE_TURNS):
-            if message.stop_reason != "pause_turn":
-                break
-            normalized.append({"role": "assistant", "content": message.content})
-            kwargs["messages"] = normalized
-            async with self._client.beta.messages.stream(**kwargs) as stream:
-                message = await stream.get_final_message()
-            self._track_message_usage(message)
-
-        text_out = self._extract_text(message.content) or None
-        tool_calls: list[ToolCall] = []
-
-        for block in message.content:
-            # Only handle client-side tool_use, not server_tool_use.
-            # The content union holds many block shapes (thinking, server-tool
-            # results, compaction, etc.) that don't carry id/name/input — pull
-            # those fields via getattr so pyright doesn't see attribute access
-            # on the wrong side of the union.
-            if getattr(block, "type", None) != "tool_use":
-                continue
-            block_id = getattr(block, "id", None)
-            block_name = getattr(block, "name", None)
-            if not block_id or not block_name:
-                continue
-            block_input = getattr(block, "input", None)
-            tool_calls.append(ToolCall(
-                id=block_id,
-                name=block_name,
-                arguments=block_input if isinstance(block_input, dict) else {},
-            ))
-
-        return text_out, tool_calls
+        message = await self._create_message(kwargs, normalized)
+        text, tool_calls = self._partition_content(message.content)
+        return text or None, tool_calls
 
     def _append_tool_result(
         self,
@@ -258,7 +347,6 @@ class AnthropicBackend(Backend):
         call: ToolCall,
         result: str,
     ) -> list[Any]:
-        messages = list(messages)
         messages.append({
             "role": "assistant",
             "content": [
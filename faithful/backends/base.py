@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
+import hashlib
 import json
 import logging
 import time
+import weakref
 from pathlib import Path
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # optional speedup, installed with faithful[speedups]
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from faithful.config import Config
 
@@ -23,6 +32,32 @@ SPONTANEOUS_PROMPT = (
 
 MAX_TOOL_ROUNDS = 5
 
+MAX_CONCURRENT_TOOL_CALLS = 4
+
+# Rough ratio for the session token budget; no tokenizer is needed to trim
+CHARS_PER_TOKEN = 4
+
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 3600.0
+# Above this temperature the same input is expected to produce different
+# output, so replaying a cached response would change behavior.
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+
+
+def _dumps_for_cache(obj: Any) -> bytes:
+    """Serialize *obj* deterministically for hashing; orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=repr, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, default=repr).encode()
+
+
+def _estimate_tokens(message: dict[str, Any]) -> int:
+    """Cheap token estimate for a session message, tool results included."""
+    content = message.get("content")
+    if not isinstance(content, str):
+        content = str(content or message.get("results") or "")
+    return len(content) // CHARS_PER_TOKEN + 1
+
 
 def _detect_media_type(data: bytes) -> str:
     """Detect image media type from magic bytes. Defaults to image/png."""
@@ -35,25 +70,24 @@ def _detect_media_type(data: bytes) -> str:
     return "image/png"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attachment:
     """A downloaded file attachment (image, etc.) from a Discord message."""
 
     filename: str
     content_type: str
     data: bytes
+    b64: str = field(init=False, repr=False, compare=False)
+    """Base64 payload, encoded once here rather than on every API round."""
+    media_type: str = field(init=False, repr=False, compare=False)
+    """Media type detected from magic bytes instead of trusting content_type."""
 
-    @property
-    def b64(self) -> str:
-        return base64.b64encode(self.data).decode()
-
-    @property
-    def media_type(self) -> str:
-        """Detect media type from magic bytes instead of trusting content_type."""
-        return _detect_media_type(self.data)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "b64", base64.b64encode(self.data).decode())
+        object.__setattr__(self, "media_type", _detect_media_type(self.data))
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool invocation parsed from an LLM response."""
 
@@ -62,7 +96,7 @@ class ToolCall:
     arguments: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerationRequest:
     """Everything a backend needs to produce a response."""
 
@@ -78,13 +112,20 @@ class GenerationRequest:
 class SessionHistory:
     """Per-channel conversation state with sliding window and expiry."""
 
-    __slots__ = ("channel_id", "messages", "last_activity", "max_messages", "_expiry")
+    __slots__ = ("channel_id", "messages", "last_activity", "max_messages", "max_tokens", "_expiry")
 
-    def __init__(self, channel_id: int, max_messages: int, expiry: float) -> None:
+    def __init__(
+        self,
+        channel_id: int,
+        max_messages: int,
+        expiry: float,
+        max_tokens: int = 0,
+    ) -> None:
         self.channel_id = channel_id
         self.messages: list[dict[str, Any]] = []
         self.last_activity: float = time.monotonic()
         self.max_messages = max_messages
+        self.max_tokens = max_tokens
         self._expiry = expiry
 
     @property
@@ -104,9 +145,23 @@ class SessionHistory:
         self.messages = [dict(m) for m in context]
 
     def trim(self) -> None:
-        """Trim to max_messages, removing from the front."""
+        """Trim to max_messages and the estimated max_tokens budget, removing from the front.
+
+        The newest message is always kept.
+        """
         if len(self.messages) > self.max_messages:
             self.messages = self.messages[-self.max_messages:]
+        if not self.max_tokens:
+            return
+        budget = self.max_tokens
+        start = len(self.messages) - 1
+        while start > 0:
+            budget -= _estimate_tokens(self.messages[start])
+            if budget - _estimate_tokens(self.messages[start - 1]) < 0:
+                break
+            start -= 1
+        if start > 0:
+            self.messages = self.messages[start:]
 
 
 class Backend(ABC):
@@ -131,10 +186,26 @@ class Backend(ABC):
     def __init__(self, config: Config) -> None:
         self.config = config
         self._sessions = {}
-        self._lock = asyncio.Lock()
+        # Entries vanish once no turn holds or awaits the lock, so channels
+        # the bot answered once don't accumulate for the process lifetime
+        self._locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._api_semaphore = asyncio.Semaphore(config.llm.max_concurrent_requests)
+        # key -> (monotonic expiry, response text)
+        self._response_cache: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+        # key -> provider call in flight for it; resolves to None if that call failed
+        self._inflight: dict[str, asyncio.Future[tuple[str | None, list[ToolCall]] | None]] = {}
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
 
+    def _channel_lock(self, channel_id: int) -> asyncio.Lock:
+        """Return the lock serialising generation for one channel's session."""
+        lock = self._locks.get(channel_id)
+        if lock is None:
+            lock = self._locks[channel_id] = asyncio.Lock()
+        return lock
+
     def _get_session(self, channel_id: int) -> SessionHistory:
         """Return existing session or create a new one. Expired sessions are reset."""
         session = self._sessions.get(channel_id)
@@ -143,6 +214,7 @@ class Backend(ABC):
                 channel_id=channel_id,
                 max_messages=self.config.behavior.max_session_messages,
                 expiry=self.config.behavior.conversation_expiry,
+                max_tokens=self.config.behavior.max_session_tokens,
             )
             self._sessions[channel_id] = session
         return session
@@ -182,10 +254,17 @@ class Backend(ABC):
         if not raw:
             return {}
         try:
-            return json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, TypeError):
             return {}
 
+    @staticmethod
+    def _dump_json_args(args: dict[str, Any]) -> str:
+        """Serialize tool arguments to the JSON string providers expect."""
+        if orjson is not None:
+            return orjson.dumps(args).decode()
+        return json.dumps(args)
+
     def _get_active_tools(self) -> list[dict[str, Any]]:
         """Return provider-agnostic tool defs enabled by config."""
         from faithful.tools import (
@@ -206,6 +285,96 @@ class Backend(ABC):
         tools.append(TOOL_CONTINUE)
         return tools
 
+    @functools.cached_property
+    def _formatted_tools(self) -> Any:
+        """Provider-format tool list, built once -- it only depends on config."""
+        return self._format_tools(self._get_active_tools())
+
+    def _response_cache_key(
+        self,
+        system_prompt: str,
+        messages: list[Any],
+        tools: Any,
+        attachments: list[Attachment] | None,
+    ) -> str | None:
+        """Return a cache key for a near-deterministic call, or None if uncacheable."""
+        if attachments or self.config.llm.temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        payload = _dumps_for_cache([
+            self.config.backend.model,
+            system_prompt,
+            messages,
+            tools,
+        ])
+        return hashlib.sha256(payload).hexdigest()
+
+    def _cached_response(self, key: str | None) -> tuple[bool, str | None]:
+        """Look up *key*, returning ``(hit, text)``. Expired entries are dropped."""
+        if key is None:
+            return False, None
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return False, None
+        expires, text = entry
+        if time.monotonic() > expires:
+            del self._response_cache[key]
+            return False, None
+        self._response_cache.move_to_end(key)
+        return True, text
+
+    def _cache_response(self, key: str | None, text: str | None) -> None:
+        if key is None:
+            return
+        self._response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, text)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def _call_provider(
+        self,
+        system_prompt: str,
+        messages: list[Any],
+        tools: Any,
+        attachments: list[Attachment] | None,
+    ) -> tuple[str | None, list[ToolCall]]:
+        async with self._api_semaphore:
+            return await self._call_with_tools(system_prompt, messages, tools, attachments)
+
+    async def _call_coalesced(
+        self,
+        cache_key: str | None,
+        system_prompt: str,
+        messages: list[Any],
+        tools: Any,
+        attachments: list[Attachment] | None,
+    ) -> tuple[str | None, list[ToolCall]]:
+        """Call the provider, letting identical concurrent requests share one call.
+
+        Only plain replies are shared -- like the response cache, a waiter whose
+        leader got tool calls (or failed) makes its own call.
+        """
+        if cache_key is None:
+            return await self._call_provider(system_prompt, messages, tools, attachments)
+
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            shared = await asyncio.shield(pending)
+            if shared is not None and not shared[1]:
+                return shared
+            return await self._call_provider(system_prompt, messages, tools, attachments)
+
+        fut: asyncio.Future[tuple[str | None, list[ToolCall]] | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[cache_key] = fut
+        result = None
+        try:
+            result = await self._call_provider(system_prompt, messages, tools, attachments)
+            return result
+        finally:
+            del self._inflight[cache_key]
+            fut.set_result(result)
+
     def _track_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Accumulate token usage and log expensive turns."""
         self.total_input_tokens += input_tokens
@@ -220,8 +389,13 @@ class Backend(ABC):
     async def generate(
         self, request: GenerationRequest
     ) -> AsyncGenerator[str, None]:
-        """Generate response text, yielding each message as it's ready."""
-        async with self._lock:
+        """Generate response text, yielding each message as it's ready.
+
+        Turns in the same channel run one at a time so its session stays
+        consistent; different channels generate concurrently, bounded by
+        ``llm.max_concurrent_requests`` in-flight provider calls.
+        """
+        async with self._channel_lock(request.channel_id):
             session = self._get_session(request.channel_id)
             session.touch()
 
@@ -237,13 +411,12 @@ class Backend(ABC):
             else:
                 session.append({"role": "user", "content": SPONTANEOUS_PROMPT})
 
-            tools = self._get_active_tools()
             collected_text: list[str] = []
 
             async for text in self._generate_with_tools(
                 request.system_prompt,
                 session,
-                tools,
+                self._formatted_tools,
                 request.attachments or None,
                 request.channel_id,
                 request.participants,
@@ -261,26 +434,36 @@ class Backend(ABC):
         self,
         system_prompt: str,
         session: SessionHistory,
-        tools: list[dict[str, Any]],
+        formatted_tools: Any,
         attachments: list[Attachment] | None,
         channel_id: int,
         participants: dict[int, str],
     ) -> AsyncGenerator[str, None]:
         from faithful.tools import ToolExecutor
 
-        formatted_tools = self._format_tools(tools)
         executor = ToolExecutor(self.memory_base_dir, channel_id, participants)
         continue_count = 0
         max_continues = self.config.behavior.max_continues
 
-        # Build a working copy of messages for the API call.
-        # Provider-specific tool results get appended here during the loop.
+        # Build a working copy of messages for the API call. Provider-specific
+        # tool results get appended to it in place during the loop.
         messages: list[Any] = list(session.messages)
 
         for _ in range(MAX_TOOL_ROUNDS + max_continues):
-            text, tool_calls = await self._call_with_tools(
+            cache_key = self._response_cache_key(
                 system_prompt, messages, formatted_tools, attachments
             )
+            hit, text = self._cached_response(cache_key)
+            if hit:
+                tool_calls = []
+            else:
+                text, tool_calls = await self._call_coalesced(
+                    cache_key, system_prompt, messages, formatted_tools, attachments
+                )
+                # Tool calls have side effects (memory writes), so only plain
+                # replies are replayed from the cache.
+                if not tool_calls:
+                    self._cache_response(cache_key, text)
             # Only pass attachments on the first round
             attachments = None
 
@@ -289,6 +472,12 @@ class Backend(ABC):
                     yield text.strip()
                 return
 
+            # Run the round's real tool calls concurrently; results come back
+            # in call order so they can be appended below.
+            pending = iter(await self._execute_tool_calls(
+                executor, [call for call in tool_calls if call.name != "continue"]
+            ))
+
             # Separate continue from regular tool calls
             wants_continue = False
             for call in tool_calls:
@@ -298,11 +487,12 @@ class Backend(ABC):
                         messages, call, '{"status": "ok"}'
                     )
                 else:
-                    result = await executor.execute(call.name, call.arguments)
-                    log.info(
-                        "Tool %s(%s) -> %s",
-                        call.name, call.arguments, result[:200],
-                    )
+                    result = next(pending)
+                    if log.isEnabledFor(logging.INFO):
+                        log.info(
+                            "Tool %s(%s) -> %s",
+                            call.name, call.arguments, result[:200],
+                        )
                     messages = self._append_tool_result(messages, call, result)
                     # Persist tool round in session (provider-agnostic)
                     self._store_tool_round(session, call, result)
@@ -314,10 +504,28 @@ class Backend(ABC):
             # Otherwise loop continues to get the LLM's response to tool results
 
         # Exhausted rounds — do a final call without tools
-        final = await self._call_api(system_prompt, messages)
+        cache_key = self._response_cache_key(system_prompt, messages, None, None)
+        hit, final = self._cached_response(cache_key)
+        if not hit:
+            async with self._api_semaphore:
+                final = await self._call_api(system_prompt, messages)
+            self._cache_response(cache_key, final)
         if final:
             yield final.strip()
 
+    @staticmethod
+    async def _execute_tool_calls(executor: Any, calls: list[ToolCall]) -> list[str]:
+        """Execute independent tool calls concurrently, returning results in order."""
+        if not calls:
+            return []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
+        async def run(call: ToolCall) -> str:
+            async with semaphore:
+                return await executor.execute(call.name, call.arguments)
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
     def _format_tools(self, tools: list[dict[str, Any]]) -> Any:
         """Convert provider-agnostic tool defs to provider format."""
         raise NotImplementedError
@@ -338,5 +546,8 @@ class Backend(ABC):
         call: ToolCall,
         result: str,
     ) -> list[Any]:
-        """Append a tool call and its result to messages in provider format."""
+        """Append a tool call and its result to *messages* in provider format.
+
+        Mutates and returns *messages*; the tool loop owns its working copy.
+        """
         raise NotImplementedError
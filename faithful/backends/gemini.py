@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, cast
 
 from google import genai
@@ -12,6 +16,19 @@ if TYPE_CHECKING:
 
 DEFAULT_MODEL = "gemini-2.0-flash"
 
+# Attachments larger than this are uploaded through the File API and referenced
+# by URI, rather than base64-inlined (+33%) into the request body.
+_FILE_API_THRESHOLD = 1_000_000
+
+# System prompts seen recently enough to keep their request config around
+_GEN_CONFIG_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=8)
+def _make_client(api_key: str) -> genai.Client:
+    """Return a shared client per API key so its connection pool survives backend re-creation."""
+    return genai.Client(api_key=api_key)
+
 
 class GeminiBackend(Backend):
     """Generates text via the Google Gemini API."""
@@ -20,7 +37,12 @@ class GeminiBackend(Backend):
 
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        self._client = genai.Client(api_key=config.backend.api_key)
+        self._client = _make_client(config.backend.api_key)
+        # Config is read-only at runtime, so the server tool objects are
+        # built once and shared by every request.
+        self._server_tools = self._native_server_tools()
+        # (system prompt, tool variant) -> request config
+        self._gen_configs: OrderedDict[tuple[str, str], types.GenerateContentConfig] = OrderedDict()
 
     @staticmethod
     def _to_contents(messages: list[Any]) -> list[dict[str, Any]]:
@@ -38,6 +60,29 @@ class GeminiBackend(Backend):
                 contents.append({"role": role, "parts": [{"text": msg.get("content", "")}]})
         return contents
 
+    async def _attachment_part(self, att: Attachment) -> dict[str, Any]:
+        """Return the content part for one attachment, uploading it if large."""
+        if len(att.data) > _FILE_API_THRESHOLD:
+            uploaded = await self._client.aio.files.upload(
+                file=io.BytesIO(att.data),
+                config=types.UploadFileConfig(mime_type=att.media_type, display_name=att.filename),
+            )
+            if uploaded.uri:
+                return {"file_data": {"mime_type": att.media_type, "file_uri": uploaded.uri}}
+        return {"inline_data": {"mime_type": att.media_type, "data": att.b64}}
+
+    async def _apply_attachments(
+        self,
+        contents: list[dict[str, Any]],
+        attachments: list[Attachment] | None,
+    ) -> list[dict[str, Any]]:
+        """Attach images as parts on the last message."""
+        if not attachments:
+            return contents
+        parts = await asyncio.gather(*(self._attachment_part(att) for att in attachments))
+        contents[-1]["parts"].extend(parts)
+        return contents
+
     def _native_server_tools(self) -> list[types.Tool] | None:
         """Return native Gemini tools enabled by config.
 
@@ -53,36 +98,56 @@ class GeminiBackend(Backend):
             ]
         return None
 
+    def _generation_config(self, system_prompt: str, tools: Any) -> types.GenerateContentConfig:
+        """Return the request config for *system_prompt* and *tools*, built once per pair.
+
+        The system prompt is stable between corpus reloads and *tools* is one
+        of the tool lists this backend holds, so tool rounds and follow-up
+        turns reuse the same object instead of re-validating a new one. Any
+        other tool list gets a fresh, uncached config.
+        """
+        if tools is None:
+            variant = "none"
+        elif tools is self._server_tools:
+            variant = "server"
+        elif tools is self._formatted_tools:
+            variant = "all"
+        else:
+            return self._build_generation_config(system_prompt, tools)
+
+        key = (system_prompt, variant)
+        config = self._gen_configs.get(key)
+        if config is None:
+            config = self._build_generation_config(system_prompt, tools)
+            self._gen_configs[key] = config
+            if len(self._gen_configs) > _GEN_CONFIG_CACHE_SIZE:
+                self._gen_configs.popitem(last=False)
+        else:
+            self._gen_configs.move_to_end(key)
+        return config
+
+    def _build_generation_config(self, system_prompt: str, tools: Any) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            temperature=self.config.llm.temperature,
+            max_output_tokens=self.config.llm.max_tokens,
+            tools=cast(Any, tools),
+        )
+
     async def _call_api(
         self,
         system_prompt: str,
         messages: list[dict[str, str]],
         attachments: list[Attachment] | None = None,
     ) -> str:
-        contents = self._to_contents(messages)
-
-        if attachments:
-            last_parts = contents[-1]["parts"]
-            for att in attachments:
-                b64 = att.b64
-                last_parts.append({
-                    "inline_data": {
-                        "mime_type": att.media_type,
-                        "data": b64,
-                    },
-                })
+        contents = await self._apply_attachments(self._to_contents(messages), attachments)
 
         # `contents` and `tools` are unions of TypedDicts/SDK classes; pyright
         # can't narrow our looser dict-based shapes, so cast at the boundary.
         response = await self._client.aio.models.generate_content(
             model=self.config.backend.model or DEFAULT_MODEL,
             contents=cast(Any, contents),
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=self.config.llm.temperature,
-                max_output_tokens=self.config.llm.max_tokens,
-                tools=cast(Any, self._native_server_tools()),
-            ),
+            config=self._generation_config(system_prompt, self._server_tools),
         )
         return (response.text or "").strip()
 
@@ -98,9 +163,8 @@ class GeminiBackend(Backend):
             ))
         all_tools: list[types.Tool] = [types.Tool(function_declarations=declarations)]
         # Add native server tools alongside function tools
-        native = self._native_server_tools()
-        if native:
-            all_tools.extend(native)
+        if self._server_tools:
+            all_tools.extend(self._server_tools)
         return all_tools
 
     async def _call_with_tools(
@@ -110,28 +174,12 @@ class GeminiBackend(Backend):
         tools: Any,
         attachments: list[Attachment] | None = None,
     ) -> tuple[str | None, list[ToolCall]]:
-        contents = self._to_contents(messages)
-
-        if attachments:
-            last_parts = contents[-1]["parts"]
-            for att in attachments:
-                b64 = att.b64
-                last_parts.append({
-                    "inline_data": {
-                        "mime_type": att.media_type,
-                        "data": b64,
-                    },
-                })
+        contents = await self._apply_attachments(self._to_contents(messages), attachments)
 
         response = await self._client.aio.models.generate_content(
             model=self.config.backend.model or DEFAULT_MODEL,
             contents=cast(Any, contents),
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=self.config.llm.temperature,
-                max_output_tokens=self.config.llm.max_tokens,
-                tools=cast(Any, tools),
-            ),
+            config=self._generation_config(system_prompt, tools),
         )
 
         text_out: str | None = None
@@ -162,7 +210,6 @@ class GeminiBackend(Backend):
         call: ToolCall,
         result: str,
     ) -> list[Any]:
-        messages = list(messages)
         # Model message with FunctionCall part
         messages.append({
             "role": "model",
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, cast
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from .base import Attachment, Backend, ToolCall
 
@@ -12,6 +14,64 @@ if TYPE_CHECKING:
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# The SDK default drops idle connections after 5s, so most replies would pay a
+# fresh TCP/TLS handshake; tool rounds and follow-up turns reuse these instead.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_client(api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+    """Return a shared client per endpoint so its connection pool survives backend re-creation.
+
+    Also used by the openai-compatible backend.
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
+    )
+
+
+def _input_image_part(url: str) -> dict[str, Any]:
+    return {"type": "input_image", "image_url": url}
+
+
+def _build_openai_messages(
+    system_message: dict[str, Any],
+    messages: list[Any],
+    attachments: list[Attachment] | None,
+    text_type: str,
+    image_part: Callable[[str], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Assemble an OpenAI-style message list behind *system_message*.
+
+    Shared by the Responses and Chat Completions backends, which differ only in
+    the system role and the part types passed in. Attachments become image
+    parts on the last message.
+    """
+    out: list[dict[str, Any]] = [system_message]
+    # Skip provider-agnostic tool round entries from session history;
+    # the tool loop builds provider-specific format via _append_tool_result
+    out.extend(
+        msg for msg in messages
+        if msg.get("role") != "tool_results" and "tool_calls" not in msg
+    )
+
+    if attachments:
+        last = out[-1]
+        content: list[dict[str, Any]] = [
+            {"type": text_type, "text": last.get("content", "")},
+        ]
+        content.extend(
+            image_part(f"data:{att.media_type};base64,{att.b64}") for att in attachments
+        )
+        out[-1] = {"role": last["role"], "content": content}
+    return out
+
 
 class OpenAIBackend(Backend):
     """Generates text via the OpenAI Responses API."""
@@ -20,7 +80,12 @@ class OpenAIBackend(Backend):
 
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        self._client = AsyncOpenAI(api_key=config.backend.api_key)
+        self._client = _make_client(config.backend.api_key)
+        # Routes requests sharing a persona prompt to the same prompt cache
+        self._prompt_cache_key = f"faithful-{config.behavior.persona_name}"
+        # Config is read-only at runtime, so these are built once
+        self._server_tools = self._native_server_tools()
+        self._system_message: dict[str, Any] = {"role": "developer", "content": ""}
 
     def _build_input(
         self,
@@ -28,29 +93,13 @@ class OpenAIBackend(Backend):
         messages: list[Any],
         attachments: list[Attachment] | None = None,
     ) -> list[dict[str, Any]]:
-        input_messages: list[dict[str, Any]] = [
-            {"role": "developer", "content": system_prompt},
-        ]
-        for msg in messages:
-            # Skip provider-agnostic tool round entries from session history;
-            # the tool loop builds provider-specific format via _append_tool_result
-            if msg.get("role") == "tool_results" or "tool_calls" in msg:
-                continue
-            input_messages.append(msg)
-
-        if attachments:
-            last = input_messages[-1]
-            content: list[dict[str, Any]] = [
-                {"type": "input_text", "text": last.get("content", "")},
-            ]
-            for att in attachments:
-                b64 = att.b64
-                content.append({
-                    "type": "input_image",
-                    "image_url": f"data:{att.media_type};base64,{b64}",
-                })
-            input_messages[-1] = {"role": last["role"], "content": content}
-        return input_messages
+        # The system prompt only changes when the corpus reloads; reuse its
+        # message dict until then. Nothing downstream mutates it.
+        if self._system_message["content"] != system_prompt:
+            self._system_message = {"role": "developer", "content": system_prompt}
+        return _build_openai_messages(
+            self._system_message, messages, attachments, "input_text", _input_image_part
+        )
 
     def _native_server_tools(self) -> list[dict[str, Any]]:
         """Return native OpenAI server-side tools enabled by config.
@@ -69,6 +118,15 @@ class OpenAIBackend(Backend):
             {"type": "code_interpreter", "container": {"type": "auto"}},
         ]
 
+    async def _create_response(self, kwargs: dict[str, Any]) -> Any:
+        """Stream one response and return it once complete."""
+        # Streaming means a cancelled debounce task exits the context manager
+        # and closes the connection, so OpenAI stops generating tokens nobody
+        # will see. Text is still delivered whole: one yield from generate()
+        # is one Discord message.
+        async with self._client.responses.stream(**kwargs) as stream:
+            return await stream.get_final_response()
+
     async def _call_api(
         self,
         system_prompt: str,
@@ -76,7 +134,7 @@ class OpenAIBackend(Backend):
         attachments: list[Attachment] | None = None,
     ) -> str:
         input_messages = self._build_input(system_prompt, messages, attachments)
-        tools = self._native_server_tools()
+        tools = self._server_tools
 
         # The Responses API expects a tightly-typed ResponseInputParam list
         # (a union of TypedDicts), but our message dicts are loose at the
@@ -87,11 +145,12 @@ class OpenAIBackend(Backend):
             "input": cast(Any, input_messages),
             "max_output_tokens": self.config.llm.max_tokens,
             "temperature": self.config.llm.temperature,
+            "prompt_cache_key": self._prompt_cache_key,
         }
         if tools:
             kwargs["tools"] = cast(Any, tools)
 
-        response = await self._client.responses.create(**kwargs)
+        response = await self._create_response(kwargs)
         return (response.output_text or "").strip()
 
     # ── Tool support ─────────────────────────────────────
@@ -103,7 +162,7 @@ class OpenAIBackend(Backend):
         ]
         # Prepend native server tools (web_search, code_interpreter) so the
         # model sees them alongside our function tools.
-        return self._native_server_tools() + formatted
+        return self._server_tools + formatted
 
     async def _call_with_tools(
         self,
@@ -114,13 +173,14 @@ class OpenAIBackend(Backend):
     ) -> tuple[str | None, list[ToolCall]]:
         input_messages = self._build_input(system_prompt, messages, attachments)
 
-        response = await self._client.responses.create(
-            model=self.config.backend.model or DEFAULT_MODEL,
-            input=cast(Any, input_messages),
-            tools=cast(Any, tools),
-            max_output_tokens=self.config.llm.max_tokens,
-            temperature=self.config.llm.temperature,
-        )
+        response = await self._create_response({
+            "model": self.config.backend.model or DEFAULT_MODEL,
+            "input": cast(Any, input_messages),
+            "tools": cast(Any, tools),
+            "max_output_tokens": self.config.llm.max_tokens,
+            "temperature": self.config.llm.temperature,
+            "prompt_cache_key": self._prompt_cache_key,
+        })
 
         text: str | None = None
         tool_calls: list[ToolCall] = []
@@ -148,12 +208,11 @@ class OpenAIBackend(Backend):
         call: ToolCall,
         result: str,
     ) -> list[Any]:
-        messages = list(messages)
         messages.append({
             "type": "function_call",
             "call_id": call.id,
             "name": call.name,
-            "arguments": json.dumps(call.arguments),
+            "arguments": self._dump_json_args(call.arguments),
         })
         messages.append({
             "type": "function_call_output",
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, cast
 
-from openai import AsyncOpenAI
-
 from .base import Attachment, Backend, ToolCall
+from .openai import _build_openai_messages, _make_client
 
 if TYPE_CHECKING:
     from faithful.config import Config
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# User turns shorter than this go to backend.fast_model when one is set
+FAST_MODEL_MAX_CHARS = 200
+
+
+def _image_url_part(url: str) -> dict[str, Any]:
+    return {"type": "image_url", "image_url": {"url": url}}
+
 
 class OpenAICompatibleBackend(Backend):
     """Generates text via the OpenAI-compatible Chat Completions API.
@@ -26,10 +31,29 @@ class OpenAICompatibleBackend(Backend):
             raise ValueError(
                 "openai-compatible backend requires 'base_url' in [backend] config"
             )
-        self._client = AsyncOpenAI(
-            api_key=config.backend.api_key or "not-needed",
-            base_url=config.backend.base_url,
+        self._client = _make_client(
+            config.backend.api_key or "not-needed",
+            config.backend.base_url,
         )
+        self._system_message: dict[str, Any] = {"role": "system", "content": ""}
+
+    def _model_for(
+        self,
+        messages: list[Any],
+        attachments: list[Attachment] | None,
+    ) -> str:
+        """Route short, text-only user turns to ``fast_model`` when configured."""
+        fast_model = self.config.backend.fast_model
+        if fast_model and not attachments and messages:
+            last = messages[-1]
+            content = last.get("content")
+            if (
+                last.get("role") == "user"
+                and isinstance(content, str)
+                and len(content) < FAST_MODEL_MAX_CHARS
+            ):
+                return fast_model
+        return self.config.backend.model or DEFAULT_MODEL
 
     def _build_messages(
         self,
@@ -37,28 +61,13 @@ class OpenAICompatibleBackend(Backend):
         messages: list[Any],
         attachments: list[Attachment] | None = None,
     ) -> list[dict[str, Any]]:
-        full: list[dict[str, Any]] = [
-            {"role": "system", "content": system_prompt},
-        ]
-        for msg in messages:
-            # Skip provider-agnostic tool round entries from session history
-            if msg.get("role") == "tool_results" or "tool_calls" in msg:
-                continue
-            full.append(msg)
-
-        if attachments:
-            last = full[-1]
-            content: list[dict[str, Any]] = [
-                {"type": "text", "text": last.get("content", "")},
-            ]
-            for att in attachments:
-                b64 = att.b64
-                content.append({
-                    "type": "image_url",
-                    "image_url": {"url": f"data:{att.media_type};base64,{b64}"},
-                })
-            full[-1] = {"role": last["role"], "content": content}
-        return full
+        # The system prompt only changes when the corpus reloads; reuse its
+        # message dict until then. Nothing downstream mutates it.
+        if self._system_message["content"] != system_prompt:
+            self._system_message = {"role": "system", "content": system_prompt}
+        return _build_openai_messages(
+            self._system_message, messages, attachments, "text", _image_url_part
+        )
 
     async def _call_api(
         self,
@@ -72,7 +81,7 @@ class OpenAICompatibleBackend(Backend):
         # union; our dicts match the runtime shapes but pyright can't narrow
         # the loose dict[str, Any]. Cast at the SDK boundary.
         response = await self._client.chat.completions.create(
-            model=self.config.backend.model or DEFAULT_MODEL,
+            model=self._model_for(messages, attachments),
             messages=cast(Any, full),
             max_tokens=self.config.llm.max_tokens,
             temperature=self.config.llm.temperature,
@@ -104,7 +113,7 @@ class OpenAICompatibleBackend(Backend):
         full = self._build_messages(system_prompt, messages, attachments)
 
         response = await self._client.chat.completions.create(
-            model=self.config.backend.model or DEFAULT_MODEL,
+            model=self._model_for(messages, attachments),
             messages=cast(Any, full),
             tools=cast(Any, tools),
             max_tokens=self.config.llm.max_tokens,
@@ -137,7 +146,6 @@ class OpenAICompatibleBackend(Backend):
         call: ToolCall,
         result: str,
     ) -> list[Any]:
-        messages = list(messages)
         messages.append({
             "role": "assistant",
             "tool_calls": [{
@@ -145,7 +153,7 @@ class OpenAICompatibleBackend(Backend):
                 "type": "function",
                 "function": {
                     "name": call.name,
-                    "arguments": json.dumps(call.arguments),
+                    "arguments": self._dump_json_args(call.arguments),
                 },
             }],
         })
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,16 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("faithful")
 
+# Quiet period before a scheduled backend refresh runs
+REFRESH_DELAY = 0.5
+
+_EXTENSIONS = (
+    "faithful.cogs.admin",
+    "faithful.cogs.chat",
+    "faithful.cogs.scheduler",
+    "faithful.cogs.onboarding",
+)
+
 
 class Faithful(commands.Bot):
     """The persona-emulating Discord bot."""
@@ -38,17 +49,20 @@ class Faithful(commands.Bot):
         self.config = config
         self.store = MessageStore(config)
         self.backend = get_backend(config.backend.active, config)
+        self._refresh_task: asyncio.Task[None] | None = None
         if config.behavior.enable_memory:
             memory_dir = config.data_dir / "memories"
             memory_dir.mkdir(parents=True, exist_ok=True)
             self.backend.memory_base_dir = memory_dir
 
     async def setup_hook(self) -> None:
-        await self.load_extension("faithful.cogs.admin")
-        await self.load_extension("faithful.cogs.chat")
-        await self.load_extension("faithful.cogs.scheduler")
-        await self.load_extension("faithful.cogs.onboarding")
+        # Extension loads and backend setup are independent; run them together
+        await asyncio.gather(
+            *(self.load_extension(name) for name in _EXTENSIONS),
+            self._setup_backend(),
+        )
 
+    async def _setup_backend(self) -> None:
         examples = self.store.list_messages()
         if examples:
             await self.backend.setup(examples)
@@ -73,3 +87,20 @@ class Faithful(commands.Bot):
         """Re-setup the current backend (call after message corpus changes)."""
         examples = self.store.list_messages()
         await self.backend.setup(examples)
+
+    def schedule_refresh(self) -> None:
+        """Refresh the backend once the corpus stops changing.
+
+        Back-to-back admin edits restart the timer, so a burst costs a
+        single ``refresh_backend()``.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._delayed_refresh())
+
+    async def _delayed_refresh(self) -> None:
+        await asyncio.sleep(REFRESH_DELAY)
+        try:
+            await self.refresh_backend()
+        except Exception:
+            log.exception("Backend refresh failed.")
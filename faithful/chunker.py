@@ -11,6 +11,7 @@ last-resort fallback for that case.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from collections.abc import AsyncGenerator
 
@@ -31,39 +32,59 @@ def _split_oversized(text: str) -> list[str]:
     if len(text) <= _MAX_MSG_LEN:
         return [text]
 
+    # Walk a position through the original string instead of re-slicing the
+    # remainder after every chunk; only the emitted chunks are copied.
     chunks: list[str] = []
-    remaining = text
-    while remaining:
-        if len(remaining) <= _MAX_MSG_LEN:
-            chunks.append(remaining)
+    end = len(text)
+    while end and text[end - 1].isspace():
+        end -= 1
+    pos = 0
+    while pos < end:
+        if end - pos <= _MAX_MSG_LEN:
+            chunks.append(text[pos:end])
             break
 
+        window_end = pos + _MAX_MSG_LEN - 100
+
         # Try sentence boundary
         split_idx = -1
         for punc in (". ", "! ", "? "):
-            idx = remaining.rfind(punc, 0, _MAX_MSG_LEN - 100)
-            if idx > split_idx:
+            idx = text.rfind(punc, pos, window_end)
+            if idx >= 0 and idx + 1 > split_idx:
                 split_idx = idx + 1
 
         # Try space
-        if split_idx <= 0:
-            split_idx = remaining.rfind(" ", 0, _MAX_MSG_LEN - 100)
+        if split_idx < 0:
+            split_idx = text.rfind(" ", pos, window_end)
 
         # Hard cut
-        if split_idx <= 0:
-            split_idx = _MAX_MSG_LEN
+        if split_idx <= pos:
+            split_idx = pos + _MAX_MSG_LEN
 
-        chunks.append(remaining[:split_idx].strip())
-        remaining = remaining[split_idx:].strip()
+        chunks.append(text[pos:split_idx].strip())
+        pos = split_idx
+        while pos < end and text[pos].isspace():
+            pos += 1
 
     return chunks
 
 
 def extract_reactions(text: str) -> tuple[str, list[str]]:
     """Strip [react: emoji] markers from text and return (clean_text, reactions)."""
-    reactions = _REACTION_PATTERN.findall(text)
-    clean = _REACTION_PATTERN.sub("", text).strip()
-    return clean, [r.strip() for r in reactions if r.strip()]
+    if "[react:" not in text:
+        return text.strip(), []
+    # One pass builds both outputs
+    parts: list[str] = []
+    reactions: list[str] = []
+    last = 0
+    for m in _REACTION_PATTERN.finditer(text):
+        parts.append(text[last:m.start()])
+        reaction = m.group(1).strip()
+        if reaction:
+            reactions.append(reaction)
+        last = m.end()
+    parts.append(text[last:])
+    return "".join(parts).strip(), reactions
 
 
 async def send_responses(
@@ -86,23 +107,46 @@ async def send_responses(
     all_reactions: list[str] = []
     first_sent = False
 
-    async for raw_text in responses:
-        clean, reactions = extract_reactions(raw_text)
-        all_reactions.extend(reactions)
-        if not clean:
-            continue
-
-        # Normal path: one yield = one message. Only split if the model
-        # produced something larger than Discord allows in a single send.
-        pieces = [clean] if len(clean) <= _MAX_MSG_LEN else _split_oversized(clean)
-
-        for piece in pieces:
-            if not first_sent and reply_to:
+    async def send(pieces: list[str], reply: bool) -> None:
+        for i, piece in enumerate(pieces):
+            if reply and i == 0 and reply_to:
                 await reply_to.reply(piece)
             else:
                 await channel.send(piece)
+
+    # Message N is sent while message N+1 is being generated; awaiting the
+    # previous send before starting the next keeps them in order.
+    in_flight: asyncio.Task[None] | None = None
+    try:
+        async for raw_text in responses:
+            clean, reactions = extract_reactions(raw_text)
+            all_reactions.extend(reactions)
+            if not clean:
+                continue
+
+            # Normal path: one yield = one message. Only split if the model
+            # produced something larger than Discord allows in a single send.
+            pieces = [clean] if len(clean) <= _MAX_MSG_LEN else _split_oversized(clean)
+
+            if in_flight is not None:
+                await in_flight
+            in_flight = asyncio.create_task(send(pieces, not first_sent))
             first_sent = True
 
+        if in_flight is not None:
+            await in_flight
+    except asyncio.CancelledError:
+        if in_flight is not None:
+            in_flight.cancel()
+        raise
+    except Exception:
+        # A later generation failure must not drop a message that was
+        # already produced; let its send finish before propagating. A send
+        # failure here must not mask the original error.
+        if in_flight is not None and not in_flight.done():
+            await asyncio.gather(in_flight, return_exceptions=True)
+        raise
+
     if react_target and all_reactions:
         for emoji in all_reactions:
             try:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+import tempfile
+from typing import IO, TYPE_CHECKING
 
 import discord
 from discord import app_commands
@@ -16,13 +17,51 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("faithful.admin")
 
+_STATUS_TEMPLATE = (
+    "**Backend:** `{cfg.backend.active}`\n"
+    "**Model:** `{model}`\n"
+    "**Messages:** {count}\n"
+    "**Persona:** {cfg.behavior.persona_name}\n"
+    "**Reply probability:** {cfg.behavior.reply_probability:.1%}\n"
+    "**Reaction probability:** {cfg.behavior.reaction_probability:.1%}\n"
+    "**Debounce delay:** {cfg.behavior.debounce_delay}s\n"
+    "**Context limit:** {cfg.behavior.max_context_messages}\n"
+    "**Sample size:** {cfg.llm.sample_size}\n"
+    "**Temperature:** {cfg.llm.temperature}\n"
+    "**Max tokens:** {cfg.llm.max_tokens}\n"
+    "**Spontaneous channels:** {channels}\n"
+    "**Web search:** {web_search}\n"
+    "**Memory:** {memory}\n"
+    "**Admins:** {admins}"
+)
+
+def _spool_messages(messages: list[str]) -> IO[bytes]:
+    """Encode *messages* one per line into a rewound temp file.
+
+    Streams line by line, so the corpus is never held as one joined
+    string plus its encoded copy. ``TemporaryFile`` rather than
+    ``SpooledTemporaryFile``: ``discord.File`` only accepts ``io.IOBase``
+    instances, which the spooled variant isn't before Python 3.11.
+    """
+    buf = tempfile.TemporaryFile()
+    buf.writelines(
+        (f"\n{m}" if i else m).encode("utf-8") for i, m in enumerate(messages)
+    )
+    buf.seek(0)
+    return buf
+
+
+async def _reply_ephemeral(interaction: discord.Interaction, text: str) -> None:
+    """Answer an interaction with an ephemeral error or empty-state notice."""
+    await interaction.response.send_message(text, ephemeral=True)
+
 
 def is_admin():
     async def predicate(interaction: discord.Interaction) -> bool:
         bot: Faithful = interaction.client  # type: ignore[assignment]
-        if interaction.user.id not in bot.config.discord.admin_ids:
-            await interaction.response.send_message(
-                "\u26d4 You are not authorised to use this command.", ephemeral=True
+        if interaction.user.id not in bot.config.discord.admin_id_set:
+            await _reply_ephemeral(
+                interaction, "\u26d4 You are not authorised to use this command."
             )
             return False
         return True
@@ -35,6 +74,17 @@ class Admin(commands.Cog):
 
     def __init__(self, bot: Faithful) -> None:
         self.bot = bot
+        # (store version, formatted lines) so paging doesn't copy and
+        # reformat the corpus per page
+        self._lines_cache: tuple[int, list[str]] | None = None
+
+    def _display_lines(self) -> list[str]:
+        """Numbered, truncated ``/list_messages`` lines, rebuilt when the store changes."""
+        store = self.bot.store
+        if self._lines_cache is None or self._lines_cache[0] != store.version:
+            lines = [f"`{i}.` {m[:80]}" for i, m in enumerate(store.list_messages(), 1)]
+            self._lines_cache = (store.version, lines)
+        return self._lines_cache[1]
 
     # ── Messages ─────────────────────────────────────────
 
@@ -48,19 +98,26 @@ class Admin(commands.Cog):
         self, interaction: discord.Interaction, file: discord.Attachment
     ) -> None:
         if not file.filename.endswith(".txt"):
-            await interaction.response.send_message(
-                "\u274c Please upload a `.txt` file.", ephemeral=True
-            )
+            await _reply_ephemeral(interaction, "\u274c Please upload a `.txt` file.")
             return
 
         await interaction.response.defer(ephemeral=True)
 
         filename = file.filename.replace("/", "_").replace("\\", "_")
-        target_path = self.bot.config.data_dir / filename
-
-        await file.save(target_path)
-        self.bot.store.reload()
-        await self.bot.refresh_backend()
+        data = await file.read()
+        store = self.bot.store
+        path = await asyncio.to_thread(store.save_file, filename, data)
+        try:
+            lines = await asyncio.to_thread(store.read_lines, path)
+        except (OSError, UnicodeDecodeError) as e:
+            log.exception("Failed to read uploaded file '%s'.", filename)
+            await interaction.followup.send(
+                f"\u274c Saved **{filename}** but couldn't read it: {e}",
+                ephemeral=True,
+            )
+            return
+        store.load_file(path, lines)
+        self.bot.schedule_refresh()
 
         await interaction.followup.send(
             f"\u2705 Saved **{filename}** and reloaded. "
@@ -79,7 +136,7 @@ class Admin(commands.Cog):
         self, interaction: discord.Interaction, text: str
     ) -> None:
         self.bot.store.add_messages([text])
-        await self.bot.refresh_backend()
+        self.bot.schedule_refresh()
         await interaction.response.send_message(
             f"\u2705 Added message (total: {self.bot.store.count}).", ephemeral=True
         )
@@ -93,23 +150,19 @@ class Admin(commands.Cog):
     async def list_messages(
         self, interaction: discord.Interaction, page: int = 1
     ) -> None:
-        msgs = self.bot.store.list_messages()
-        if not msgs:
-            await interaction.response.send_message(
-                "\U0001f4ed No messages stored.", ephemeral=True
-            )
+        lines = self._display_lines()
+        if not lines:
+            await _reply_ephemeral(interaction, "\U0001f4ed No messages stored.")
             return
 
         per_page = 20
-        total_pages = (len(msgs) + per_page - 1) // per_page
+        total_pages = (len(lines) + per_page - 1) // per_page
         page = max(1, min(page, total_pages))
         start = (page - 1) * per_page
-        chunk = msgs[start : start + per_page]
 
-        lines = [f"`{start + i + 1}.` {m[:80]}" for i, m in enumerate(chunk)]
-        header = f"**Messages** \u2014 page {page}/{total_pages} ({len(msgs)} total)\n"
+        header = f"**Messages** \u2014 page {page}/{total_pages} ({len(lines)} total)\n"
         await interaction.response.send_message(
-            header + "\n".join(lines), ephemeral=True
+            header + "\n".join(lines[start : start + per_page]), ephemeral=True
         )
 
     @app_commands.command(
@@ -124,12 +177,10 @@ class Admin(commands.Cog):
         try:
             removed = self.bot.store.remove_message(index)
         except IndexError:
-            await interaction.response.send_message(
-                "\u274c Invalid index.", ephemeral=True
-            )
+            await _reply_ephemeral(interaction, "\u274c Invalid index.")
             return
 
-        await self.bot.refresh_backend()
+        self.bot.schedule_refresh()
         await interaction.response.send_message(
             f"\U0001f5d1\ufe0f Removed: _{removed[:80]}_\n"
             f"(total: {self.bot.store.count})",
@@ -143,7 +194,7 @@ class Admin(commands.Cog):
     @is_admin()
     async def clear_messages(self, interaction: discord.Interaction) -> None:
         count = self.bot.store.clear_messages()
-        await self.bot.refresh_backend()
+        self.bot.schedule_refresh()
         await interaction.response.send_message(
             f"\U0001f5d1\ufe0f Cleared **{count}** messages.", ephemeral=True
         )
@@ -154,16 +205,17 @@ class Admin(commands.Cog):
     )
     @is_admin()
     async def download_messages(self, interaction: discord.Interaction) -> None:
-        text = self.bot.store.get_all_text()
-        if not text:
-            await interaction.response.send_message(
-                "\U0001f4ed No messages stored.", ephemeral=True
-            )
+        messages = self.bot.store.list_messages()
+        if not messages:
+            await _reply_ephemeral(interaction, "\U0001f4ed No messages stored.")
             return
 
-        buf = io.BytesIO(text.encode("utf-8"))
+        # Encoding and uploading a large corpus can outlast the 3s
+        # interaction deadline
+        await interaction.response.defer(ephemeral=True)
+        buf = await asyncio.to_thread(_spool_messages, messages)
         file = discord.File(buf, filename="example_messages.txt")
-        await interaction.response.send_message(file=file, ephemeral=True)
+        await interaction.followup.send(file=file, ephemeral=True)
 
     # ── Status & Testing ────────────────────────────────
 
@@ -174,25 +226,17 @@ class Admin(commands.Cog):
     @is_admin()
     async def status(self, interaction: discord.Interaction) -> None:
         cfg = self.bot.config
-        lines = [
-            f"**Backend:** `{cfg.backend.active}`",
-            f"**Model:** `{cfg.backend.model or '(default)'}`",
-            f"**Messages:** {self.bot.store.count}",
-            f"**Persona:** {cfg.behavior.persona_name}",
-            f"**Reply probability:** {cfg.behavior.reply_probability:.1%}",
-            f"**Reaction probability:** {cfg.behavior.reaction_probability:.1%}",
-            f"**Debounce delay:** {cfg.behavior.debounce_delay}s",
-            f"**Context limit:** {cfg.behavior.max_context_messages}",
-            f"**Sample size:** {cfg.llm.sample_size}",
-            f"**Temperature:** {cfg.llm.temperature}",
-            f"**Max tokens:** {cfg.llm.max_tokens}",
-            f"**Spontaneous channels:** {len(cfg.scheduler.channels)}",
-            f"**Web search:** {'on' if cfg.behavior.enable_web_search else 'off'}",
-            f"**Memory:** {'on' if cfg.behavior.enable_memory else 'off'}",
-            f"**Admins:** {len(cfg.discord.admin_ids)}",
-        ]
         await interaction.response.send_message(
-            "\n".join(lines), ephemeral=True
+            _STATUS_TEMPLATE.format(
+                cfg=cfg,
+                model=cfg.backend.model or "(default)",
+                count=self.bot.store.count,
+                channels=len(cfg.scheduler.channels),
+                web_search="on" if cfg.behavior.enable_web_search else "off",
+                memory="on" if cfg.behavior.enable_memory else "off",
+                admins=len(cfg.discord.admin_ids),
+            ),
+            ephemeral=True,
         )
 
     @app_commands.command(
@@ -237,20 +281,18 @@ async def add_to_persona(
     interaction: discord.Interaction, message: discord.Message
 ) -> None:
     bot: Faithful = interaction.client  # type: ignore[assignment]
-    if interaction.user.id not in bot.config.discord.admin_ids:
-        await interaction.response.send_message(
-            "\u26d4 Only administrators can perform this action.", ephemeral=True
+    if interaction.user.id not in bot.config.discord.admin_id_set:
+        await _reply_ephemeral(
+            interaction, "\u26d4 Only administrators can perform this action."
         )
         return
 
     if not message.content.strip():
-        await interaction.response.send_message(
-            "\u274c This message has no text.", ephemeral=True
-        )
+        await _reply_ephemeral(interaction, "\u274c This message has no text.")
         return
 
     bot.store.add_messages([message.content])
-    await bot.refresh_backend()
+    bot.schedule_refresh()
     await interaction.response.send_message(
         f"\u2705 Added message to persona (total: {bot.store.count}).",
         ephemeral=True,
@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 import discord
@@ -20,24 +22,42 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("faithful.chat")
 
+# The message text is appended directly; nothing else varies
 _REACTION_PROMPT = (
     "React to this message with a single emoji that fits your personality. "
     "Just reply with the emoji and nothing else. If nothing fits, reply PASS.\n\n"
-    "Message: {message}"
+    "Message: "
 )
 
+# Recent messages per channel searched for a bot post (incl. the new one)
+CONVERSATION_LOOKBACK = 7
+
 EMPTY_STATE_TEXT = (
     "I don't have any example messages to learn from yet. "
     "An admin can use `/upload` or `/add_message` to teach me."
 )
 
 
+@dataclass(slots=True)
+class _ChannelActivity:
+    """Our newest post in a channel and how many messages have followed it."""
+
+    last_post: datetime | None = None
+    since: int = 0
+
+
 class Chat(commands.Cog):
     """Listens to messages and responds in-character."""
 
     def __init__(self, bot: Faithful) -> None:
         self.bot = bot
+        # Extensions load after login, so the bot user is already known;
+        # comparing ids skips discord.py's object equality on every message
+        self._bot_user_id = bot.user.id if bot.user else 0
         self._pending: dict[int, asyncio.Task] = {}
+        # Kept current from on_message so the conversation check needs no
+        # REST call and no history walk
+        self._activity: dict[int, _ChannelActivity] = {}
 
     def _should_reply_randomly(self) -> bool:
         return random.random() < self.bot.config.behavior.reply_probability
@@ -52,15 +72,47 @@ class Chat(commands.Cog):
             return True
         if message.reference and message.reference.resolved:
             ref = message.reference.resolved
-            if isinstance(ref, discord.Message) and ref.author == self.bot.user:
+            if isinstance(ref, discord.Message) and ref.author.id == self._bot_user_id:
                 age = (utcnow() - ref.created_at).total_seconds()
                 return age < self.bot.config.behavior.conversation_expiry
         return False
 
-    async def _maybe_react(self, message: discord.Message) -> None:
-        """Possibly react to a message without replying."""
-        if not self._should_react():
+    def _remember(self, message: discord.Message) -> None:
+        activity = self._activity.get(message.channel.id)
+        if activity is None:
             return
+        if message.author.id == self._bot_user_id:
+            activity.last_post = message.created_at
+            activity.since = 0
+        else:
+            activity.since += 1
+
+    async def _channel_activity(self, message: discord.Message) -> _ChannelActivity:
+        channel_id = message.channel.id
+        activity = self._activity.get(channel_id)
+        if activity is None:
+            # First message seen in this channel since startup: seed from
+            # Discord once; on_message keeps it current after.
+            activity = _ChannelActivity()
+            i = 0
+            async for m in message.channel.history(limit=CONVERSATION_LOOKBACK):
+                if m.author.id == self._bot_user_id:
+                    activity.last_post = m.created_at
+                    activity.since = i
+                    break
+                i += 1
+            self._activity[channel_id] = activity
+        return activity
+
+    def _in_conversation(self, activity: _ChannelActivity) -> bool:
+        """Whether we posted within the last few messages and recently enough."""
+        if activity.last_post is None or activity.since >= CONVERSATION_LOOKBACK:
+            return False
+        age = (utcnow() - activity.last_post).total_seconds()
+        return age < self.bot.config.behavior.conversation_expiry
+
+    async def _maybe_react(self, message: discord.Message) -> None:
+        """React to a message without replying; the caller rolls the chance."""
         if self.bot.store.count == 0:
             return
 
@@ -76,7 +128,7 @@ class Chat(commands.Cog):
                 custom_emojis=custom_emojis,
             )
             request = GenerationRequest(
-                prompt=_REACTION_PROMPT.format(message=message.content[:500]),
+                prompt=_REACTION_PROMPT + message.content[:500],
                 system_prompt=system_prompt,
                 channel_id=message.channel.id,
             )
@@ -129,11 +181,15 @@ class Chat(commands.Cog):
         except Exception:
             log.exception("Failed to generate response")
         finally:
-            self._pending.pop(channel_id, None)
+            # A cancelled task finishes after its replacement is registered;
+            # only clear the slot if it is still ours
+            if self._pending.get(channel_id) is asyncio.current_task():
+                del self._pending[channel_id]
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        if message.author == self.bot.user or message.author.bot:
+        self._remember(message)
+        if message.author.id == self._bot_user_id or message.author.bot:
             return
 
         if self.bot.store.count == 0:
@@ -148,28 +204,22 @@ class Chat(commands.Cog):
                     log.exception("Failed to send empty-state reply")
             return
 
-        is_dm = message.guild is None
-        is_mentioned = self._is_mentioned(message)
-
-        in_conversation = False
-        if not (is_mentioned or is_dm):
-            history: list[discord.Message] = []
-            async for m in message.channel.history(limit=7):
-                history.append(m)
-
-            if len(history) >= 2:
-                for prev_msg in history[1:]:
-                    if prev_msg.author == self.bot.user:
-                        age = (utcnow() - prev_msg.created_at).total_seconds()
-                        if age < self.bot.config.behavior.conversation_expiry:
-                            in_conversation = True
-                        break
-
-        should_reply = is_dm or is_mentioned or in_conversation or self._should_reply_randomly()
+        # Cheapest checks first: only the conversation check can await (it
+        # seeds from Discord the first time a channel is seen)
+        should_reply = (
+            message.guild is None
+            or self._is_mentioned(message)
+            or self._should_reply_randomly()
+            or self._in_conversation(await self._channel_activity(message))
+        )
 
         if not should_reply:
-            # Even when not replying, maybe react
-            asyncio.create_task(self._maybe_react(message))
+            # Even when not replying, maybe react; roll here so the common
+            # miss doesn't cost a task. Attachment/embed-only messages give
+            # the model nothing to react to.
+            content = message.content
+            if content and not content.isspace() and self._should_react():
+                asyncio.create_task(self._maybe_react(message))
             return
 
         channel_id = message.channel.id
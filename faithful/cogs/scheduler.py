@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import random
 import time
 from typing import TYPE_CHECKING
@@ -28,6 +29,7 @@ class Scheduler(commands.Cog):
         self.bot = bot
         self._task: asyncio.Task | None = None
         self._state_file = self.bot.config.data_dir / "scheduler_state.json"
+        self._last_saved: float | None = None
 
     def _load_next_run(self) -> float | None:
         if not self._state_file.exists():
@@ -39,12 +41,22 @@ class Scheduler(commands.Cog):
         except Exception:
             return None
 
-    def _save_next_run(self, timestamp: float) -> None:
+    async def _save_next_run(self, timestamp: float) -> None:
+        if timestamp == self._last_saved:
+            return
         try:
-            with open(self._state_file, "w", encoding="utf-8") as f:
-                json.dump({"next_run": timestamp}, f)
+            await asyncio.to_thread(self._write_state, timestamp)
         except Exception:
             log.warning("Failed to save scheduler state.")
+            return
+        self._last_saved = timestamp
+
+    def _write_state(self, timestamp: float) -> None:
+        # Write-then-rename so a crash mid-write never leaves a torn file
+        tmp = self._state_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"next_run": timestamp}, f)
+        os.replace(tmp, self._state_file)
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -73,13 +85,13 @@ class Scheduler(commands.Cog):
                     log.info("Next spontaneous message in %.1f hours.", delay / 3600)
                 else:
                     delay = random.uniform(min_sec, max_sec)
-                    self._save_next_run(now + delay)
+                    await self._save_next_run(now + delay)
                     log.info(
                         "Scheduled spontaneous message in %.1f hours.", delay / 3600
                     )
 
                 await asyncio.sleep(delay)
-                self._save_next_run(0)
+                await self._save_next_run(0)
 
                 await self._send_spontaneous()
 
@@ -77,10 +77,12 @@ def _merge_dataclass(instance: Any, overrides: dict) -> None:
 # ── Nested config sections ──────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscordConfig:
     token: str = ""
     admin_ids: list[int] = field(default_factory=list)
+    # Hashed copy of admin_ids for the per-interaction permission check
+    admin_id_set: frozenset[int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.token:
@@ -90,14 +92,16 @@ class DiscordConfig:
         admin_env = os.environ.get("ADMIN_USER_IDS") or os.environ.get("ADMIN_USER_ID")
         if admin_env:
             self.admin_ids = _parse_admin_ids(admin_env, None)
+        self.admin_id_set = frozenset(self.admin_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackendConfig:
     active: str = "openai-compatible"
     api_key: str = ""
     model: str = ""
     base_url: str = ""
+    fast_model: str = ""
     enable_thinking: bool = True
     enable_compaction: bool = True
     enable_1m_context: bool = True
@@ -108,19 +112,25 @@ class BackendConfig:
             self.api_key = api_env
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     temperature: float = 1.0
     max_tokens: int = 16000
     sample_size: int = 300
+    # Prompts that reuse one example sample before a fresh one is drawn;
+    # >1 keeps the system prompt byte-stable for provider prompt caching
+    sample_reuse: int = 1
+    max_concurrent_requests: int = 4
 
     def __post_init__(self) -> None:
         self.temperature = _clamp(self.temperature, 0, 2, "temperature", 1.0)
         self.sample_size = max(1, self.sample_size)
+        self.sample_reuse = max(1, self.sample_reuse)
         self.max_tokens = max(1, self.max_tokens)
+        self.max_concurrent_requests = max(1, self.max_concurrent_requests)
 
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorConfig:
     persona_name: str = "faithful"
     reply_probability: float = 0.02
@@ -131,6 +141,7 @@ class BehaviorConfig:
     enable_web_search: bool = False
     enable_memory: bool = False
     max_session_messages: int = 50
+    max_session_tokens: int = 0
     max_continues: int = 5
     system_prompt: str = ""
 
@@ -140,19 +151,20 @@ class BehaviorConfig:
         self.reaction_probability = _clamp(self.reaction_probability, 0, 1, "reaction_probability", 0.05)
         self.max_context_messages = max(0, self.max_context_messages)
         self.max_session_messages = max(1, self.max_session_messages)
+        self.max_session_tokens = max(0, self.max_session_tokens)
         self.max_continues = max(0, self.max_continues)
         if not self.system_prompt:
             self.system_prompt = DEFAULT_SYSTEM_PROMPT
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerConfig:
     channels: list[int] = field(default_factory=list)
     min_hours: float = 12.0
     max_hours: float = 24.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Bot-wide configuration loaded from config.toml with env var overrides for secrets."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import discord
@@ -12,6 +13,16 @@ if TYPE_CHECKING:
     from .bot import Faithful
 
 
+# Injected for backends without a native memory tool
+_MEMORY_PROTOCOL = (
+    "\n\nIMPORTANT: ALWAYS VIEW YOUR MEMORY DIRECTORY BEFORE DOING ANYTHING ELSE.\n"
+    "MEMORY PROTOCOL:\n"
+    "1. Use the `view` command of your `memory` tool to check for earlier progress.\n"
+    "2. As you work, record status / progress / thoughts in your memory.\n"
+    "ASSUME INTERRUPTION: Your context window might be reset at any moment.\n"
+)
+
+
 def format_system_prompt(
     template: str,
     persona_name: str,
@@ -20,33 +31,62 @@ def format_system_prompt(
     enable_memory: bool = False,
     has_native_memory: bool = False,
 ) -> str:
-    """Format a system prompt template with persona name and examples."""
-    prompt = template.format(
-        name=persona_name,
-        examples="\n".join(examples),
-        custom_emojis=custom_emojis,
+    """Format a system prompt template with persona name and examples.
+
+    The sample is stable until the corpus reloads, so identical inputs are
+    common; they return the same cached string object, which also makes
+    the backends' "prompt changed?" comparisons an identity check.
+    """
+    return _format_cached(
+        template,
+        persona_name,
+        tuple(examples),
+        custom_emojis,
+        enable_memory and not has_native_memory,
     )
+
+
+@functools.lru_cache(maxsize=32)
+def _format_cached(
+    template: str,
+    persona_name: str,
+    examples: tuple[str, ...],
+    custom_emojis: str,
+    memory_protocol: bool,
+) -> str:
+    prompt = template.format_map({
+        "name": persona_name,
+        "examples": "\n".join(examples),
+        "custom_emojis": custom_emojis,
+    })
     # Inject memory protocol for non-Anthropic backends
-    if enable_memory and not has_native_memory:
-        memory_protocol = (
-            "\n\nIMPORTANT: ALWAYS VIEW YOUR MEMORY DIRECTORY BEFORE DOING ANYTHING ELSE.\n"
-            "MEMORY PROTOCOL:\n"
-            "1. Use the `view` command of your `memory` tool to check for earlier progress.\n"
-            "2. As you work, record status / progress / thoughts in your memory.\n"
-            "ASSUME INTERRUPTION: Your context window might be reset at any moment.\n"
-        )
-        prompt += memory_protocol
+    if memory_protocol:
+        prompt += _MEMORY_PROTOCOL
     return prompt
 
 
+# guild_id -> (guild.emojis tuple the text was built from, text)
+_emoji_cache: dict[int, tuple[tuple[discord.Emoji, ...], str]] = {}
+
+
 def get_guild_emojis(guild: discord.Guild | None) -> str:
-    """Build a string listing available custom emoji for the system prompt."""
+    """Build a string listing available custom emoji for the system prompt.
+
+    Cached per guild. discord.py swaps in a new ``guild.emojis`` tuple
+    whenever the emoji set or guild changes, so an identity check on it
+    is the invalidation.
+    """
     if not guild or not guild.emojis:
         return ""
-    names = [f":{e.name}:" for e in guild.emojis if e.available]
-    if not names:
-        return ""
-    return f"Available custom emojis in this server: {', '.join(names)}\n"
+    emojis = guild.emojis
+    cached = _emoji_cache.get(guild.id)
+    if cached is not None and cached[0] is emojis:
+        return cached[1]
+
+    names = [f":{e.name}:" for e in emojis if e.available]
+    text = f"Available custom emojis in this server: {', '.join(names)}\n" if names else ""
+    _emoji_cache[guild.id] = (emojis, text)
+    return text
 
 
 
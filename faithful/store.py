@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import random
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from faithful.config import Config
@@ -19,12 +19,18 @@ class MessageStore:
         self._dir: Path = config.data_dir / "persona"
         self._messages: list[str] = []
         self._source_map: list[tuple[Path, int]] = []
+        # sample size -> [sample, prompts it has been used for]
+        self._samples: dict[int, list[Any]] = {}
+        # Bumped on every reload so callers can cache views of the corpus
+        self.version = 0
         self.reload()
 
     def reload(self) -> None:
         """Scan data directory and load all .txt messages."""
         self._messages.clear()
         self._source_map.clear()
+        self._samples.clear()
+        self.version += 1
 
         self._dir.mkdir(parents=True, exist_ok=True)
 
@@ -38,28 +44,81 @@ class MessageStore:
 
         log.info("Loaded %d messages from %d files.", len(self._messages), len(files))
 
-    def _load_txt(self, path: Path) -> None:
+    def load_file(self, path: Path, lines: list[str] | None = None) -> None:
+        """Load one new or replaced .txt file without rescanning the others.
+
+        The file's messages are spliced in at its sorted position, replacing
+        any it had before, so indices match what ``reload()`` would produce
+        without re-reading the other files. *lines* may be pre-read with
+        ``read_lines()`` off the event loop.
+        """
+        self._samples.clear()
+        self.version += 1
+        before = len(self._messages)
+
+        if not self._source_map or self._source_map[-1][0] < path:
+            self._load_txt(path, lines)
+        else:
+            messages, source_map = self._messages, self._source_map
+            keep = [i for i, (p, _) in enumerate(source_map) if p != path]
+            # Files load in sorted order, so the earlier ones form a prefix
+            split = next((n for n, i in enumerate(keep) if source_map[i][0] > path), len(keep))
+            self._messages = [messages[i] for i in keep[:split]]
+            self._source_map = [source_map[i] for i in keep[:split]]
+            self._load_txt(path, lines)
+            self._messages.extend(messages[i] for i in keep[split:])
+            self._source_map.extend(source_map[i] for i in keep[split:])
+
+        log.info("Loaded %d messages from %s.", len(self._messages) - before, path.name)
+
+    @staticmethod
+    def read_lines(path: Path) -> list[str]:
+        """Read a message file's raw lines. Touches no store state, so it is
+        safe to run in a worker thread."""
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readlines()
+
+    def _load_txt(self, path: Path, lines: list[str] | None = None) -> None:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    if line.strip():
-                        self._messages.append(line.strip())
-                        self._source_map.append((path, i))
+            if lines is None:
+                lines = self.read_lines(path)
+            for i, line in enumerate(lines):
+                if line.strip():
+                    self._messages.append(line.strip())
+                    self._source_map.append((path, i))
         except Exception:
             log.exception("Failed to load text file: %s", path)
 
+    def save_file(self, filename: str, data: bytes) -> Path:
+        """Write an uploaded .txt file into the persona directory.
+
+        The payload is written in one call, which bypasses the 8 KiB
+        buffer. Blocking; call via ``asyncio.to_thread``.
+        """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = self._dir / filename
+        path.write_bytes(data)
+        return path
+
     def add_messages(self, lines: list[str]) -> int:
-        """Add messages to the default 'messages.txt' file."""
+        """Add messages to the default 'messages.txt' file.
+
+        Multi-line entries are split so each line counts as one message,
+        matching how the file is read back.
+        """
         target = self._dir / "messages.txt"
 
-        cleaned = [ln.strip() for ln in lines if ln.strip()]
+        cleaned = [
+            stripped
+            for text in lines
+            for ln in text.splitlines()
+            if (stripped := ln.strip())
+        ]
         if not cleaned:
             return 0
 
         with open(target, "a", encoding="utf-8") as f:
-            for line in cleaned:
-                f.write(f"{line}\n")
+            f.write("".join(f"{line}\n" for line in cleaned))
 
         self.reload()
         return len(cleaned)
@@ -118,6 +177,23 @@ class MessageStore:
     def get_sampled_messages(self, count: int) -> list[str]:
         """Get a balanced sample of messages from all source files.
 
+        A fresh sample is drawn per call unless ``llm.sample_reuse`` is
+        raised; then each sample serves that many prompts (or until the
+        corpus changes), keeping the system prompt byte-identical so
+        providers' prompt-prefix caches hit, at the cost of variety.
+        """
+        reuse = self.config.llm.sample_reuse
+        if reuse <= 1:
+            return self._draw_sample(count)
+        entry = self._samples.get(count)
+        if entry is None or entry[1] >= reuse:
+            entry = self._samples[count] = [self._draw_sample(count), 0]
+        entry[1] += 1
+        return list(entry[0])
+
+    def _draw_sample(self, count: int) -> list[str]:
+        """Draw a fresh balanced sample.
+
         Uses index tracking to avoid duplicates when filling remaining slots.
         """
         if not self._messages:
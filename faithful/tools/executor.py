@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -11,6 +12,24 @@ from faithful.tools.memory import MemoryExecutor
 
 log = logging.getLogger("faithful.tools")
 
+MAX_FETCH_CHARS = 50_000
+
+
+def _page_to_json(url: str, raw: str, is_html: bool) -> str:
+    """Extract page text, truncate, and serialize the web_fetch result.
+
+    CPU-bound for large pages, so callers run it in a worker thread.
+    """
+    if is_html:
+        from bs4 import BeautifulSoup
+
+        text = BeautifulSoup(raw, "html.parser").get_text(separator="\n", strip=True)
+    else:
+        text = raw
+    if len(text) > MAX_FETCH_CHARS:
+        text = text[:MAX_FETCH_CHARS] + "\n\n[Content truncated]"
+    return json.dumps({"url": url, "content": text})
+
 
 class ToolExecutor:
     """Executes tool calls, dispatching to the appropriate implementation."""
@@ -48,7 +67,6 @@ class ToolExecutor:
         except ImportError:
             return json.dumps({"error": "Web search unavailable (duckduckgo-search not installed)."})
 
-        import asyncio
         import functools
 
         try:
@@ -75,7 +93,7 @@ class ToolExecutor:
         except ImportError:
             return json.dumps({"error": "Web fetch unavailable (aiohttp not installed)."})
         try:
-            from bs4 import BeautifulSoup
+            import bs4  # noqa: F401
         except ImportError:
             return json.dumps({"error": "Web fetch unavailable (beautifulsoup4 not installed)."})
 
@@ -85,19 +103,14 @@ class ToolExecutor:
                     if resp.status != 200:
                         return json.dumps({"error": f"HTTP {resp.status} for {url}"})
                     content_type = resp.content_type or ""
-                    if "html" in content_type or "text" in content_type:
-                        raw = await resp.text(errors="replace")
-                        if "html" in content_type:
-                            soup = BeautifulSoup(raw, "html.parser")
-                            text = soup.get_text(separator="\n", strip=True)
-                        else:
-                            text = raw
-                        # Truncate to ~50k chars
-                        if len(text) > 50_000:
-                            text = text[:50_000] + "\n\n[Content truncated]"
-                        return json.dumps({"url": url, "content": text})
-                    else:
+                    if "html" not in content_type and "text" not in content_type:
                         return json.dumps({"error": f"Unsupported content type: {content_type}"})
+                    raw = await resp.text(errors="replace")
+            # Parse and serialize outside the event loop so a large page
+            # doesn't stall other channels.
+            return await asyncio.to_thread(
+                _page_to_json, url, raw, "html" in content_type
+            )
         except Exception as e:
             return json.dumps({"error": f"Fetch failed: {e}"})
 
@@ -0,0 +1,26 @@
+"""Tests for helpers in the admin cog."""
+import io
+
+import discord
+
+from faithful.cogs.admin import _spool_messages
+
+
+def test_spool_messages_is_a_discord_file_object():
+    buf = _spool_messages(["hello", "wörld"])
+    try:
+        # discord.File only treats IOBase instances as file objects
+        assert isinstance(buf, io.IOBase)
+        assert buf.tell() == 0
+        assert buf.read() == "hello\nwörld".encode("utf-8")
+    finally:
+        buf.close()
+
+
+def test_spool_messages_wraps_in_discord_file():
+    buf = _spool_messages(["a"])
+    file = discord.File(buf, filename="example_messages.txt")
+    try:
+        assert file.fp is buf
+    finally:
+        file.close()
@@ -0,0 +1,165 @@
+"""Tests for faithful.backends.anthropic — client reuse and message shaping."""
+
+from __future__ import annotations
+
+from faithful.backends.anthropic import AnthropicBackend, _make_client
+from faithful.config import Config
+
+
+class TestClientCache:
+    def test_same_key_reuses_client(self):
+        assert _make_client("key-a") is _make_client("key-a")
+
+    def test_different_keys_get_different_clients(self):
+        assert _make_client("key-a") is not _make_client("key-b")
+
+    def test_backends_share_client(self):
+        cfg = Config()
+        cfg.backend.api_key = "key-shared"
+        assert AnthropicBackend(cfg)._client is AnthropicBackend(cfg)._client
+
+
+class TestCacheBreakpoints:
+    def _backend(self) -> AnthropicBackend:
+        cfg = Config()
+        cfg.backend.api_key = "key-cache"
+        return AnthropicBackend(cfg)
+
+    def test_string_content_becomes_marked_block(self):
+        msgs = [{"role": "user", "content": "hi"}]
+        kwargs = self._backend()._build_kwargs("sys", msgs)
+        last = kwargs["messages"][-1]["content"][-1]
+        assert last == {"type": "text", "text": "hi", "cache_control": {"type": "ephemeral"}}
+        # Input is not mutated
+        assert msgs == [{"role": "user", "content": "hi"}]
+
+    def test_block_content_marks_last_block_only(self):
+        blocks = [{"type": "tool_result", "tool_use_id": "a", "content": "x"}]
+        msgs = [
+            {"role": "user", "content": "first"},
+            {"role": "user", "content": blocks},
+        ]
+        out = AnthropicBackend._with_cache_breakpoint(msgs)
+        assert out[0] is msgs[0]
+        assert out[1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[0]
+
+    def test_last_tool_marked(self):
+        tools = [{"name": "a"}, {"name": "b"}]
+        kwargs = self._backend()._build_kwargs("sys", [{"role": "user", "content": "hi"}], tools)
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in tools[1]
+
+
+class TestNormalizeMessages:
+    def test_merges_consecutive_same_role(self):
+        out = AnthropicBackend._normalize_messages([
+            {"role": "user", "content": "a"},
+            {"role": "user", "content": "b"},
+            {"role": "assistant", "content": "c"},
+            {"role": "user", "content": "d"},
+        ])
+        assert out == [
+            {"role": "user", "content": "a\nb"},
+            {"role": "assistant", "content": "c"},
+            {"role": "user", "content": "d"},
+        ]
+
+    def test_drops_leading_assistant_and_tool_entries(self):
+        out = AnthropicBackend._normalize_messages([
+            {"role": "assistant", "content": "stale"},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool_results", "results": []},
+            {"role": "user", "content": "again"},
+        ])
+        assert out == [{"role": "user", "content": "hi\nagain"}]
+
+    def test_list_content_is_never_merged(self):
+        blocks = [{"type": "tool_result", "tool_use_id": "1", "content": "ok"}]
+        out = AnthropicBackend._normalize_messages([
+            {"role": "user", "content": "a"},
+            {"role": "user", "content": blocks},
+            {"role": "user", "content": "b"},
+            {"role": "user", "content": "c"},
+        ])
+        assert out == [
+            {"role": "user", "content": "a"},
+            {"role": "user", "content": blocks},
+            {"role": "user", "content": "b\nc"},
+        ]
+
+    def test_only_assistant_falls_back_to_spontaneous(self):
+        out = AnthropicBackend._normalize_messages([{"role": "assistant", "content": "x"}])
+        assert out[0]["role"] == "user"
+
+
+class TestAppendToolResult:
+    def test_appends_in_place(self):
+        from faithful.backends.base import ToolCall
+
+        cfg = Config()
+        cfg.backend.api_key = "key-tools"
+        messages: list = [{"role": "user", "content": "hi"}]
+        out = AnthropicBackend(cfg)._append_tool_result(
+            messages, ToolCall(id="t1", name="memory", arguments={}), "ok"
+        )
+        assert out is messages
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        assert messages[2]["content"][0]["tool_use_id"] == "t1"
+
+
+class TestRetries:
+    def test_client_retries_transient_errors(self):
+        assert _make_client("key-retry").max_retries == 5
+
+
+class TestPartitionContent:
+    def test_splits_text_and_tool_use(self):
+        from types import SimpleNamespace as NS
+
+        content = [
+            NS(type="thinking", thinking="hmm"),
+            NS(type="text", text="hello"),
+            NS(type="server_tool_use", id="s1", name="web_search", input={}),
+            NS(type="tool_use", id="t1", name="continue", input={}),
+            NS(type="text", text="world"),
+            NS(type="tool_use", id=None, name="broken", input={}),
+        ]
+        text, calls = AnthropicBackend._partition_content(content)
+        assert text == "hello\nworld"
+        assert [(c.id, c.name) for c in calls] == [("t1", "continue")]
+
+
+class TestNormalizeFastPath:
+    def test_alternating_input_is_returned_as_new_list(self):
+        msgs = [
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "b"},
+            {"role": "user", "content": "c"},
+        ]
+        out = AnthropicBackend._normalize_messages(msgs)
+        assert out == msgs
+        assert out is not msgs
+        assert out[0] is msgs[0]
+
+    def test_empty_input_still_gets_spontaneous_prompt(self):
+        out = AnthropicBackend._normalize_messages([])
+        assert out[0]["role"] == "user"
+
+
+class TestStaticKwargs:
+    def test_config_constants_resolved_once(self):
+        cfg = Config()
+        cfg.backend.api_key = "key-static"
+        cfg.backend.enable_thinking = False
+        cfg.backend.enable_compaction = False
+        cfg.backend.enable_1m_context = False
+        backend = AnthropicBackend(cfg)
+        kwargs = backend._build_kwargs("sys", [{"role": "user", "content": "hi"}])
+        assert kwargs["model"] == "claude-sonnet-4-20250514"
+        assert kwargs["max_tokens"] == cfg.llm.max_tokens
+        assert "thinking" not in kwargs and "betas" not in kwargs
+        # Per-request keys never leak into the shared dict
+        assert "messages" not in backend._static_kwargs
@@ -23,3 +23,14 @@ class TestBackendRegistry:
         with pytest.raises((ImportError, Exception)):
             get_backend("ANTHROPIC", None)  # type: ignore[arg-type]
         # But it shouldn't be ValueError
+
+    def test_registry_is_read_only(self):
+        from faithful.backends import _BACKEND_REGISTRY
+
+        with pytest.raises(TypeError):
+            _BACKEND_REGISTRY["x"] = ("a", "b", "c")  # type: ignore[index]
+
+    def test_class_lookup_is_memoized(self):
+        from faithful.backends import _load_backend_class
+
+        assert _load_backend_class("anthropic") is _load_backend_class("anthropic")
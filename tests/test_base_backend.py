@@ -1,8 +1,11 @@
-"""Tests for faithful.backends.base — Backend features (lock, token tracking, media type)."""
+"""Tests for faithful.backends.base — Backend features (locks, token tracking, media type, response cache)."""
 
 from __future__ import annotations
 
 import asyncio
+import gc
+
+import pytest
 
 from faithful.backends.base import Attachment, Backend, _detect_media_type
 
@@ -61,7 +64,7 @@ class TestAttachmentMediaType:
 
 class TestBackendInit:
     def test_has_lock(self):
-        """Backend instances should have an asyncio.Lock."""
+        """Each channel gets its own asyncio.Lock, reused across turns."""
         # We can't instantiate Backend directly (abstract), but we can check
         # that the __init__ signature sets up the lock via a minimal subclass.
         class Stub(Backend):
@@ -72,7 +75,35 @@ class TestBackendInit:
 
         cfg = Config()
         stub = Stub(cfg)
-        assert isinstance(stub._lock, asyncio.Lock)
+        lock = stub._channel_lock(1)
+        assert isinstance(lock, asyncio.Lock)
+        assert stub._channel_lock(1) is lock
+        assert stub._channel_lock(2) is not lock
+
+    def test_unused_locks_are_dropped(self):
+        class Stub(Backend):
+            async def _call_api(self, system_prompt, messages, attachments=None):
+                return ""
+
+        from faithful.config import Config
+
+        stub = Stub(Config())
+        stub._channel_lock(1)
+        gc.collect()
+        assert 1 not in stub._locks
+
+    def test_api_semaphore_from_config(self):
+        class Stub(Backend):
+            async def _call_api(self, system_prompt, messages, attachments=None):
+                return ""
+
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.max_concurrent_requests = 2
+        stub = Stub(cfg)
+        assert isinstance(stub._api_semaphore, asyncio.Semaphore)
+        assert stub._api_semaphore._value == 2
 
     def test_token_tracking_initial(self):
         class Stub(Backend):
@@ -101,3 +132,234 @@ class TestBackendInit:
         stub._track_usage(50, 50)
         assert stub.total_input_tokens == 150
         assert stub.total_output_tokens == 250
+
+
+# ── Response cache ─────────────────────────────────────
+
+
+class _CountingStub(Backend):
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    async def _call_api(self, system_prompt, messages, attachments=None):
+        return ""
+
+    def _format_tools(self, tools):
+        return [t["name"] for t in tools]
+
+    async def _call_with_tools(self, system_prompt, messages, tools, attachments=None):
+        self.calls += 1
+        return "reply", []
+
+
+async def _run(backend: Backend, channel_id: int) -> list[str]:
+    from faithful.backends.base import GenerationRequest
+
+    request = GenerationRequest(prompt="hi", system_prompt="sys", channel_id=channel_id)
+    return [t async for t in backend.generate(request)]
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_deterministic_repeat_is_served_from_cache(self):
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.temperature = 0.0
+        stub = _CountingStub(cfg)
+        assert await _run(stub, 1) == ["reply"]
+        assert await _run(stub, 2) == ["reply"]
+        assert stub.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_bypasses_cache(self):
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.temperature = 1.0
+        stub = _CountingStub(cfg)
+        await _run(stub, 1)
+        await _run(stub, 2)
+        assert stub.calls == 2
+
+
+class TestRequestCoalescing:
+    class _SlowStub(_CountingStub):
+        def __init__(self, config, tool_calls=()):
+            super().__init__(config)
+            self.tool_calls = list(tool_calls)
+
+        async def _call_with_tools(self, system_prompt, messages, tools, attachments=None):
+            self.calls += 1
+            await asyncio.sleep(0.02)
+            if self.calls == 1 and self.tool_calls:
+                return None, self.tool_calls
+            return "reply", []
+
+        def _append_tool_result(self, messages, call, result):
+            messages.append({"role": "tool", "content": result})
+            return messages
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.temperature = 0.0
+        stub = self._SlowStub(cfg)
+        results = await asyncio.gather(_run(stub, 1), _run(stub, 2), _run(stub, 3))
+        assert results == [["reply"]] * 3
+        assert stub.calls == 1
+        assert stub._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_tool_call_results_are_not_shared(self):
+        from faithful.backends.base import ToolCall
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.temperature = 0.0
+        cfg.behavior.max_continues = 0
+        stub = self._SlowStub(cfg, [ToolCall(id="c", name="continue")])
+        results = await asyncio.gather(_run(stub, 1), _run(stub, 2))
+        assert results == [["reply"], ["reply"]]
+        # Leader: tool round + follow-up; the waiter makes its own call
+        assert stub.calls == 3
+
+
+class TestAttachmentB64:
+    def test_encoded_once_at_construction(self):
+        # A stored field, not a property that re-encodes on every access
+        assert not isinstance(getattr(Attachment, "b64", None), property)
+        att = Attachment(filename="t.bin", content_type="image/png", data=b"hello")
+        assert att.b64 == "aGVsbG8="
+
+    def test_excluded_from_equality(self):
+        a = Attachment("a", "image/png", b"x")
+        b = Attachment("a", "image/png", b"x")
+        assert a == b
+
+
+# ── Tool execution ─────────────────────────────────────
+
+
+class TestExecuteToolCalls:
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_and_keeps_order(self):
+        from faithful.backends.base import ToolCall
+
+        in_flight = 0
+        peak = 0
+
+        class SlowExecutor:
+            async def execute(self, name, args):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01 * args["delay"])
+                in_flight -= 1
+                return name
+
+        calls = [
+            ToolCall(id="a", name="first", arguments={"delay": 3}),
+            ToolCall(id="b", name="second", arguments={"delay": 1}),
+            ToolCall(id="c", name="third", arguments={"delay": 2}),
+        ]
+        results = await Backend._execute_tool_calls(SlowExecutor(), calls)
+        assert results == ["first", "second", "third"]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_no_calls(self):
+        assert await Backend._execute_tool_calls(None, []) == []
+
+
+class TestFormattedToolsCache:
+    def test_formatted_once_per_instance(self):
+        from faithful.config import Config
+
+        stub = _CountingStub(Config())
+        first = stub._formatted_tools
+        assert first is stub._formatted_tools
+        assert "continue" in first
+
+
+class TestSlots:
+    def test_value_types_have_no_instance_dict(self):
+        from faithful.backends.base import GenerationRequest, ToolCall
+
+        for obj in (
+            Attachment("a", "image/png", b"x"),
+            ToolCall(id="1", name="n"),
+            GenerationRequest(prompt="p", system_prompt="s"),
+        ):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestResponseCacheExpiry:
+    def test_expired_entries_miss(self, monkeypatch):
+        from faithful.backends import base
+        from faithful.config import Config
+
+        stub = _CountingStub(Config())
+        stub._cache_response("k", "v")
+        assert stub._cached_response("k") == (True, "v")
+        monkeypatch.setattr(base, "RESPONSE_CACHE_TTL", -1.0)
+        stub._cache_response("k", "v")
+        assert stub._cached_response("k") == (False, None)
+        assert "k" not in stub._response_cache
+
+    def test_uncacheable_key_never_hits(self):
+        from faithful.config import Config
+
+        stub = _CountingStub(Config())
+        stub._cache_response(None, "v")
+        assert stub._cached_response(None) == (False, None)
+
+    def test_key_is_sensitive_to_case_and_whitespace(self):
+        from faithful.config import Config
+
+        cfg = Config()
+        cfg.llm.temperature = 0.0
+        stub = _CountingStub(cfg)
+        a = stub._response_cache_key("sys", [{"role": "user", "content": "Hi  there\n"}], None, None)
+        b = stub._response_cache_key("sys", [{"role": "user", "content": "hi there"}], None, None)
+        c = stub._response_cache_key("sys", [{"role": "user", "content": "HI THERE"}], None, None)
+        # Casing and spacing carry tone the persona mirrors; never conflate them
+        assert len({a, b, c}) == 3
+
+
+class TestJsonFallback:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parse_json_args(self, monkeypatch, use_orjson):
+        from faithful.backends import base
+
+        if not use_orjson:
+            monkeypatch.setattr(base, "orjson", None)
+        assert Backend._parse_json_args('{"q": "x"}') == {"q": "x"}
+        assert Backend._parse_json_args("not json") == {}
+        assert Backend._parse_json_args(None) == {}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_json_args_round_trips(self, monkeypatch, use_orjson):
+        from faithful.backends import base
+
+        if not use_orjson:
+            monkeypatch.setattr(base, "orjson", None)
+        raw = Backend._dump_json_args({"query": "caf\u00e9", "n": 3})
+        assert isinstance(raw, str)
+        assert Backend._parse_json_args(raw) == {"query": "caf\u00e9", "n": 3}
+
+    def test_cache_key_without_orjson(self, monkeypatch):
+        from faithful.backends import base
+        from faithful.config import Config
+
+        monkeypatch.setattr(base, "orjson", None)
+        cfg = Config()
+        cfg.llm.temperature = 0.0
+        stub = _CountingStub(cfg)
+        msgs = [{"role": "user", "content": "hi"}]
+        key = stub._response_cache_key("sys", msgs, [{"name": "continue"}], None)
+        assert key is not None and len(key) == 64
+        assert key == stub._response_cache_key("sys", msgs, [{"name": "continue"}], None)
@@ -0,0 +1,41 @@
+"""Tests for faithful.bot — backend refresh scheduling."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faithful import bot as bot_module
+from faithful.bot import Faithful
+
+
+def _make_bot() -> Faithful:
+    # Skip discord.py's client setup; only the refresh plumbing is under test
+    bot = Faithful.__new__(Faithful)
+    bot.store = MagicMock()
+    bot.backend = MagicMock()
+    bot.backend.setup = AsyncMock()
+    bot._refresh_task = None
+    return bot
+
+
+class TestScheduleRefresh:
+    @pytest.mark.asyncio
+    async def test_burst_coalesces_into_one_refresh(self, monkeypatch):
+        monkeypatch.setattr(bot_module, "REFRESH_DELAY", 0.01)
+        bot = _make_bot()
+        for _ in range(5):
+            bot.schedule_refresh()
+        assert bot._refresh_task is not None
+        await bot._refresh_task
+        assert bot.backend.setup.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_logged_not_raised(self, monkeypatch):
+        monkeypatch.setattr(bot_module, "REFRESH_DELAY", 0)
+        bot = _make_bot()
+        bot.backend.setup.side_effect = RuntimeError("boom")
+        bot.schedule_refresh()
+        assert bot._refresh_task is not None
+        await bot._refresh_task  # must not raise
@@ -0,0 +1,161 @@
+"""Tests for faithful.cogs.chat — reply triggers and conversation tracking."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from discord.utils import utcnow
+
+from faithful.cogs.chat import CONVERSATION_LOOKBACK, Chat
+
+
+def _make_bot() -> MagicMock:
+    bot = MagicMock()
+    bot.user = MagicMock()
+    bot.user.mentioned_in.return_value = False
+    bot.store.count = 1
+    bot.config.behavior.reply_probability = 0.0
+    bot.config.behavior.reaction_probability = 0.0
+    bot.config.behavior.conversation_expiry = 300
+    return bot
+
+
+def _make_message(author, channel, age: float = 0.0) -> MagicMock:
+    msg = MagicMock()
+    msg.author = author
+    msg.channel = channel
+    msg.guild = MagicMock()
+    msg.reference = None
+    msg.created_at = utcnow() - timedelta(seconds=age)
+    return msg
+
+
+def _make_channel(history: list | None = None) -> MagicMock:
+    channel = MagicMock()
+    channel.id = 1
+
+    async def _history(limit):
+        for m in (history or [])[:limit]:
+            yield m
+
+    channel.history = MagicMock(side_effect=_history)
+    return channel
+
+
+def _human() -> MagicMock:
+    author = MagicMock()
+    author.bot = False
+    return author
+
+
+class TestConversationTracking:
+    @pytest.mark.asyncio
+    async def test_history_fetched_once_per_channel(self):
+        bot = _make_bot()
+        cog = Chat(bot)
+        channel = _make_channel()
+
+        for _ in range(3):
+            await cog.on_message(_make_message(_human(), channel))
+
+        assert channel.history.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_bot_post_starts_conversation(self):
+        bot = _make_bot()
+        cog = Chat(bot)
+        channel = _make_channel()
+
+        await cog._channel_activity(_make_message(_human(), channel))  # seed
+        cog._remember(_make_message(bot.user, channel, age=10))
+        cog._remember(_make_message(_human(), channel))
+
+        assert cog._in_conversation(cog._activity[channel.id])
+
+    @pytest.mark.asyncio
+    async def test_bot_post_scrolled_out_of_lookback(self):
+        bot = _make_bot()
+        cog = Chat(bot)
+        channel = _make_channel()
+
+        await cog._channel_activity(_make_message(_human(), channel))
+        cog._remember(_make_message(bot.user, channel))
+        for _ in range(CONVERSATION_LOOKBACK - 1):
+            cog._remember(_make_message(_human(), channel))
+        assert cog._in_conversation(cog._activity[channel.id])
+
+        cog._remember(_make_message(_human(), channel))
+        assert not cog._in_conversation(cog._activity[channel.id])
+
+    @pytest.mark.asyncio
+    async def test_seeded_from_history(self):
+        bot = _make_bot()
+        cog = Chat(bot)
+        human = _human()
+        channel = _make_channel([
+            _make_message(human, None),
+            _make_message(human, None),
+            _make_message(bot.user, None, age=600),
+        ])
+
+        activity = await cog._channel_activity(_make_message(human, channel))
+        assert activity.since == 2
+        assert not cog._in_conversation(activity)  # stale
+
+
+class TestReplyShortCircuit:
+    @pytest.mark.asyncio
+    async def test_random_hit_skips_history_fetch(self, monkeypatch):
+        bot = _make_bot()
+        bot.config.behavior.reply_probability = 1.0
+        cog = Chat(bot)
+        channel = _make_channel()
+        monkeypatch.setattr(cog, "_debounced_respond", AsyncMock())
+
+        await cog.on_message(_make_message(_human(), channel))
+
+        channel.history.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_reaction_for_empty_content(self, monkeypatch):
+        bot = _make_bot()
+        bot.config.behavior.reaction_probability = 1.0
+        cog = Chat(bot)
+        channel = _make_channel()
+        react = AsyncMock()
+        monkeypatch.setattr(cog, "_maybe_react", react)
+
+        for content in ("", "   "):
+            msg = _make_message(_human(), channel)
+            msg.content = content
+            await cog.on_message(msg)
+        msg.content = "nice"
+        await cog.on_message(msg)
+        await asyncio.sleep(0)
+
+        react.assert_awaited_once_with(msg)
+
+
+class TestPendingResponses:
+    @pytest.mark.asyncio
+    async def test_cancelled_task_keeps_replacement_registered(self, monkeypatch):
+        bot = _make_bot()
+        bot.user.mentioned_in.return_value = True
+        bot.config.behavior.debounce_delay = 10
+        cog = Chat(bot)
+        channel = _make_channel()
+        channel.typing = MagicMock(return_value=AsyncMock())
+
+        await cog.on_message(_make_message(_human(), channel))
+        first = cog._pending[channel.id]
+        await asyncio.sleep(0)  # first task is now debouncing
+        await cog.on_message(_make_message(_human(), channel))
+        second = cog._pending[channel.id]
+
+        await asyncio.sleep(0)  # let the first task unwind
+        assert first.done()
+        assert cog._pending[channel.id] is second
+        second.cancel()
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from faithful.chunker import _split_oversized, extract_reactions
+import asyncio
+
+import pytest
+
+from faithful.chunker import _split_oversized, extract_reactions, send_responses
 
 
 class TestSplitOversized:
@@ -57,6 +61,18 @@ class TestSplitOversized:
         assert len(chunks[1]) == 1000
 
 
+class TestSplitOversizedWalk:
+    def test_trailing_whitespace_does_not_force_a_split(self):
+        text = "a" * 1990 + " " * 50
+        assert _split_oversized(text) == ["a" * 1990]
+
+    def test_chunks_cover_text_without_leading_whitespace(self):
+        text = ("Sentence here.   " * 400).strip()
+        chunks = _split_oversized(text)
+        assert all(len(c) <= 2000 and c == c.strip() for c in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+
 class TestExtractReactions:
     def test_single_reaction(self):
         text, reactions = extract_reactions("Hello! [react: 👍]")
@@ -85,3 +101,76 @@ class TestExtractReactions:
     def test_empty_reaction_filtered(self):
         text, reactions = extract_reactions("[react:   ]")
         assert reactions == []
+
+    def test_marker_like_text_without_match_kept(self):
+        text, reactions = extract_reactions("  see [react: unterminated  ")
+        assert text == "see [react: unterminated"
+        assert reactions == []
+
+
+class _FakeChannel:
+    def __init__(self, log: list):
+        self.log = log
+
+    async def send(self, text):
+        await asyncio.sleep(0.02)
+        self.log.append(("send", text))
+
+
+class _FakeMessage:
+    def __init__(self, log: list):
+        self.log = log
+
+    async def reply(self, text):
+        await asyncio.sleep(0.02)
+        self.log.append(("reply", text))
+
+    async def add_reaction(self, emoji):
+        self.log.append(("react", emoji))
+
+
+class TestSendResponses:
+    @pytest.mark.asyncio
+    async def test_sends_in_order_overlapping_generation(self):
+        log: list = []
+
+        async def gen():
+            for text in ("one [react: 👍]", "two", "three"):
+                log.append(("yield", text))
+                yield text
+
+        msg = _FakeMessage(log)
+        await send_responses(_FakeChannel(log), gen(), react_target=msg, reply_to=msg)
+
+        sent = [entry for entry in log if entry[0] in ("send", "reply")]
+        assert sent == [("reply", "one"), ("send", "two"), ("send", "three")]
+        # The second yield is pulled before the first message finishes sending
+        assert log.index(("yield", "two")) < log.index(("reply", "one"))
+        assert log[-1] == ("react", "👍")
+
+    @pytest.mark.asyncio
+    async def test_generation_error_still_sends_produced_message(self):
+        log: list = []
+
+        async def gen():
+            yield "one"
+            raise RuntimeError("provider error")
+
+        with pytest.raises(RuntimeError):
+            await send_responses(_FakeChannel(log), gen())
+
+        assert log == [("send", "one")]
+
+    @pytest.mark.asyncio
+    async def test_generation_error_not_masked_by_failing_send(self):
+        class FailingChannel:
+            async def send(self, text):
+                await asyncio.sleep(0.02)
+                raise ConnectionError("send failed")
+
+        async def gen():
+            yield "one"
+            raise RuntimeError("provider error")
+
+        with pytest.raises(RuntimeError, match="provider error"):
+            await send_responses(FailingChannel(), gen())
@@ -108,6 +108,10 @@ class TestLLMConfig:
         c = LLMConfig(sample_size=0)
         assert c.sample_size == 1
 
+    def test_min_max_concurrent_requests(self):
+        c = LLMConfig(max_concurrent_requests=0)
+        assert c.max_concurrent_requests == 1
+
 
 class TestBehaviorConfig:
     def test_defaults(self):
@@ -128,6 +132,15 @@ class TestBehaviorConfig:
         c = BehaviorConfig(max_session_messages=0)
         assert c.max_session_messages == 1
 
+    def test_min_session_tokens(self):
+        c = BehaviorConfig(max_session_tokens=-5)
+        assert c.max_session_tokens == 0
+
+    def test_unknown_attribute_rejected(self):
+        c = BehaviorConfig()
+        with pytest.raises(AttributeError):
+            c.reply_probabilty = 0.5  # type: ignore[attr-defined]
+
     def test_custom_system_prompt_preserved(self):
         c = BehaviorConfig(system_prompt="custom {name}")
         assert c.system_prompt == "custom {name}"
@@ -265,6 +278,7 @@ class TestConfigEnvOverrides:
         config_path.write_text("")
         cfg = Config.from_file(config_path, data_dir=tmp_path / "data")
         assert cfg.discord.admin_ids == [10, 20, 30]
+        assert cfg.discord.admin_id_set == frozenset({10, 20, 30})
 
 
 # ── New contract tests ──────────────────────────────────
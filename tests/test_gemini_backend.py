@@ -0,0 +1,82 @@
+"""Tests for faithful.backends.gemini — client and tool object reuse."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace as NS
+
+import pytest
+
+from faithful.backends.gemini import GeminiBackend
+from faithful.config import Config
+
+
+def _backend(web_search: bool = True) -> GeminiBackend:
+    cfg = Config()
+    cfg.backend.api_key = "key-gemini"
+    cfg.behavior.enable_web_search = web_search
+    return GeminiBackend(cfg)
+
+
+class TestServerTools:
+    def test_built_once_and_reused_by_format_tools(self):
+        backend = _backend()
+        assert backend._server_tools is not None
+        formatted = backend._formatted_tools
+        assert formatted[1:] == backend._server_tools
+        assert all(a is b for a, b in zip(formatted[1:], backend._server_tools))
+
+    def test_disabled_web_search_has_no_server_tools(self):
+        backend = _backend(web_search=False)
+        assert backend._server_tools is None
+        assert len(backend._formatted_tools) == 1
+
+
+class TestGenerationConfig:
+    def test_reused_for_same_prompt_and_tools(self):
+        backend = _backend()
+        tools = backend._formatted_tools
+        first = backend._generation_config("sys", tools)
+        assert backend._generation_config("sys", tools) is first
+        assert backend._generation_config("other", tools) is not first
+        assert backend._generation_config("sys", backend._server_tools) is not first
+        assert first.system_instruction == "sys"
+
+    def test_unknown_tool_list_is_not_cached(self):
+        backend = _backend()
+        tools = list(backend._formatted_tools)
+        first = backend._generation_config("sys", tools)
+        assert backend._generation_config("sys", tools) is not first
+        assert not backend._gen_configs
+
+    def test_cache_is_bounded(self):
+        from faithful.backends.gemini import _GEN_CONFIG_CACHE_SIZE
+
+        backend = _backend()
+        for i in range(_GEN_CONFIG_CACHE_SIZE + 5):
+            backend._generation_config(f"prompt {i}", None)
+        assert len(backend._gen_configs) == _GEN_CONFIG_CACHE_SIZE
+
+
+class TestAttachments:
+    @pytest.mark.asyncio
+    async def test_small_inline_large_uploaded(self):
+        from faithful.backends.base import Attachment
+        from faithful.backends.gemini import _FILE_API_THRESHOLD
+
+        backend = _backend()
+        uploads: list = []
+
+        async def upload(*, file, config):
+            uploads.append(config.mime_type)
+            return NS(uri="https://files/abc")
+
+        backend._client = NS(aio=NS(files=NS(upload=upload)))
+        small = Attachment("s.png", "image/png", b"\x89PNG small")
+        large = Attachment("l.jpg", "image/jpeg", b"\xff\xd8" + b"0" * _FILE_API_THRESHOLD)
+        contents = [{"role": "user", "parts": [{"text": "look"}]}]
+
+        out = await backend._apply_attachments(contents, [small, large])
+        parts = out[-1]["parts"]
+        assert parts[1] == {"inline_data": {"mime_type": "image/png", "data": small.b64}}
+        assert parts[2] == {"file_data": {"mime_type": "image/jpeg", "file_uri": "https://files/abc"}}
+        assert uploads == ["image/jpeg"]
@@ -0,0 +1,145 @@
+"""Tests for faithful.backends.openai and openai_compat — client reuse and message shaping."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace as NS
+
+import pytest
+
+from faithful.backends.openai import OpenAIBackend, _make_client
+from faithful.backends.openai_compat import OpenAICompatibleBackend
+from faithful.config import Config
+
+
+def _compat_config(base_url: str = "http://localhost:11434/v1") -> Config:
+    cfg = Config()
+    cfg.backend.active = "openai-compatible"
+    cfg.backend.base_url = base_url
+    return cfg
+
+
+class TestClientCache:
+    def test_same_endpoint_reuses_client(self):
+        assert _make_client("k", "http://a/v1") is _make_client("k", "http://a/v1")
+        assert _make_client("k", "http://a/v1") is not _make_client("k", "http://b/v1")
+
+    def test_compat_backends_share_client(self):
+        a = OpenAICompatibleBackend(_compat_config())
+        b = OpenAICompatibleBackend(_compat_config())
+        assert a._client is b._client
+
+    def test_openai_backend_uses_default_endpoint(self):
+        cfg = Config()
+        cfg.backend.api_key = "sk-test"
+        assert OpenAIBackend(cfg)._client is _make_client("sk-test")
+
+
+class _FakeStream:
+    def __init__(self, response, calls: list):
+        self._response = response
+        self._calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._calls.append("closed")
+
+    async def get_final_response(self):
+        return self._response
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_call_api_streams_and_closes(self):
+        cfg = Config()
+        cfg.backend.api_key = "sk-stream"
+        backend = OpenAIBackend(cfg)
+        calls: list = []
+
+        def stream(**kwargs):
+            calls.append(kwargs["prompt_cache_key"])
+            return _FakeStream(NS(output_text=" hi "), calls)
+
+        backend._client = NS(responses=NS(stream=stream))
+        out = await backend._call_api("sys", [{"role": "user", "content": "x"}])
+        assert out == "hi"
+        assert calls == [backend._prompt_cache_key, "closed"]
+
+
+class TestFastModel:
+    def _backend(self, fast_model: str = "small-q4") -> OpenAICompatibleBackend:
+        cfg = _compat_config()
+        cfg.backend.model = "big"
+        cfg.backend.fast_model = fast_model
+        return OpenAICompatibleBackend(cfg)
+
+    def test_short_text_turn_uses_fast_model(self):
+        msgs = [{"role": "user", "content": "hey"}]
+        assert self._backend()._model_for(msgs, None) == "small-q4"
+
+    def test_long_turn_attachments_and_tool_rounds_use_main_model(self):
+        from faithful.backends.base import Attachment
+
+        backend = self._backend()
+        assert backend._model_for([{"role": "user", "content": "x" * 500}], None) == "big"
+        att = Attachment("a.png", "image/png", b"\x89PNG")
+        assert backend._model_for([{"role": "user", "content": "hey"}], [att]) == "big"
+        assert backend._model_for([{"role": "tool", "content": "ok"}], None) == "big"
+
+    def test_unset_fast_model_is_a_no_op(self):
+        msgs = [{"role": "user", "content": "hey"}]
+        assert self._backend(fast_model="")._model_for(msgs, None) == "big"
+
+
+class TestSystemMessageReuse:
+    def test_reused_until_prompt_changes(self):
+        cfg = Config()
+        cfg.backend.api_key = "sk-sys"
+        backend = OpenAIBackend(cfg)
+        msgs = [{"role": "user", "content": "hi"}]
+        first = backend._build_input("sys", msgs)[0]
+        assert first == {"role": "developer", "content": "sys"}
+        assert backend._build_input("sys", msgs)[0] is first
+        assert backend._build_input("new", msgs)[0] == {"role": "developer", "content": "new"}
+
+    def test_compat_uses_system_role(self):
+        backend = OpenAICompatibleBackend(_compat_config())
+        msgs = [{"role": "user", "content": "hi"}]
+        first = backend._build_messages("sys", msgs)[0]
+        assert first == {"role": "system", "content": "sys"}
+        assert backend._build_messages("sys", msgs)[0] is first
+
+
+class TestBuildMessages:
+    def _history(self) -> list:
+        return [
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool_results", "results": []},
+            {"role": "user", "content": "look"},
+        ]
+
+    def test_responses_shape(self):
+        from faithful.backends.base import Attachment
+
+        cfg = Config()
+        cfg.backend.api_key = "sk-build"
+        att = Attachment("a.png", "image/png", b"\x89PNG")
+        out = OpenAIBackend(cfg)._build_input("sys", self._history(), [att])
+        assert [m["role"] for m in out] == ["developer", "user", "user"]
+        assert out[-1]["content"] == [
+            {"type": "input_text", "text": "look"},
+            {"type": "input_image", "image_url": f"data:image/png;base64,{att.b64}"},
+        ]
+
+    def test_chat_completions_shape(self):
+        from faithful.backends.base import Attachment
+
+        att = Attachment("a.png", "image/png", b"\x89PNG")
+        out = OpenAICompatibleBackend(_compat_config())._build_messages("sys", self._history(), [att])
+        assert [m["role"] for m in out] == ["system", "user", "user"]
+        assert out[-1]["content"] == [
+            {"type": "text", "text": "look"},
+            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{att.b64}"}},
+        ]
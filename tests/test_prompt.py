@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from faithful.prompt import format_system_prompt
+from types import SimpleNamespace as NS
+
+from faithful.prompt import format_system_prompt, get_guild_emojis
 
 
 class TestFormatSystemPrompt:
@@ -45,3 +47,29 @@ class TestFormatSystemPrompt:
             enable_memory=False,
         )
         assert "MEMORY PROTOCOL" not in result
+
+    def test_identical_inputs_reuse_cached_string(self):
+        args = ("{name}: {examples}", "Bot", ["a", "b"])
+        first = format_system_prompt(*args)
+        assert format_system_prompt(*args) is first
+        assert format_system_prompt("{name}: {examples}", "Bot", ["a", "c"]) == "Bot: a\nc"
+
+
+class TestGuildEmojis:
+    def _guild(self, *names: str):
+        return NS(id=1, emojis=tuple(NS(name=n, available=True) for n in names))
+
+    def test_reused_until_emoji_tuple_replaced(self):
+        guild = self._guild("a", "b")
+        first = get_guild_emojis(guild)  # type: ignore[arg-type]
+        assert ":a:, :b:" in first
+        assert get_guild_emojis(guild) is first  # type: ignore[arg-type]
+
+        guild.emojis = self._guild("c").emojis  # what discord.py does on update
+        assert ":c:" in get_guild_emojis(guild)  # type: ignore[arg-type]
+
+    def test_no_available_emojis(self):
+        guild = self._guild("a")
+        guild.id = 2
+        guild.emojis[0].available = False
+        assert get_guild_emojis(guild) == ""  # type: ignore[arg-type]
@@ -0,0 +1,37 @@
+"""Tests for faithful.cogs.scheduler — persisted next-run state."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from faithful.cogs.scheduler import Scheduler
+
+
+def _make_scheduler(tmp_path: Path) -> Scheduler:
+    bot = MagicMock()
+    bot.config.data_dir = tmp_path
+    return Scheduler(bot)
+
+
+class TestSchedulerState:
+    @pytest.mark.asyncio
+    async def test_round_trip_leaves_no_temp_file(self, tmp_path: Path):
+        sched = _make_scheduler(tmp_path)
+        await sched._save_next_run(123.0)
+        assert sched._load_next_run() == 123.0
+        assert [p.name for p in tmp_path.iterdir()] == ["scheduler_state.json"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_value_not_rewritten(self, tmp_path: Path, monkeypatch):
+        sched = _make_scheduler(tmp_path)
+        writes: list[float] = []
+        monkeypatch.setattr(sched, "_write_state", writes.append)
+
+        await sched._save_next_run(5.0)
+        await sched._save_next_run(5.0)
+        await sched._save_next_run(0)
+
+        assert writes == [5.0, 0]
@@ -38,6 +38,20 @@ class TestSessionHistory:
         s.trim()
         assert len(s.messages) == 1
 
+    def test_trim_to_token_budget(self):
+        s = SessionHistory(channel_id=1, max_messages=50, expiry=300, max_tokens=25)
+        for i in range(5):
+            s.append({"role": "user", "content": str(i) * 39})  # ~10 tokens each
+        s.trim()
+        assert [m["content"][0] for m in s.messages] == ["3", "4"]
+
+    def test_token_budget_keeps_newest_message(self):
+        s = SessionHistory(channel_id=1, max_messages=50, expiry=300, max_tokens=1)
+        s.append({"role": "user", "content": "a" * 100})
+        s.append({"role": "user", "content": "b" * 100})
+        s.trim()
+        assert [m["content"][0] for m in s.messages] == ["b"]
+
     def test_expired(self):
         s = SessionHistory(channel_id=1, max_messages=10, expiry=0.01)
         assert not s.expired
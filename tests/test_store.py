@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,6 +13,7 @@ from faithful.store import MessageStore
 def _make_config(data_dir: Path) -> MagicMock:
     cfg = MagicMock()
     cfg.data_dir = data_dir
+    cfg.llm.sample_reuse = 1
     return cfg
 
 
@@ -87,6 +88,18 @@ class TestMessageStore:
         store = MessageStore(_make_config(tmp_path))
         assert store.count == 2
 
+    def test_add_multiline_splits_into_messages(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        added = store.add_messages(["first\n\n  second  \nthird"])
+        assert added == 3
+        assert store.list_messages() == ["first", "second", "third"]
+
+    def test_version_bumps_on_change(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        before = store.version
+        store.add_messages(["x"])
+        assert store.version > before
+
 
 class TestSampling:
     def test_sample_fewer_than_available(self, tmp_path: Path):
@@ -126,3 +139,92 @@ class TestPersonaSubdir:
         store = MessageStore(_make_config(tmp_path))
         store.add_messages(["hello"])
         assert (tmp_path / "persona" / "messages.txt").exists()
+
+    def test_uploaded_file_lands_in_persona_subdir(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        path = store.save_file("up.txt", b"one\ntwo\n")
+        assert path == tmp_path / "persona" / "up.txt"
+        store.reload()
+        assert store.list_messages() == ["one", "two"]
+
+
+class TestLoadFile:
+    def test_appends_without_rescan(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        store.add_messages(["a"])
+        path = store.save_file("z.txt", b"b\nc\n")
+        (tmp_path / "persona" / "messages.txt").write_text("changed\n")
+        store.load_file(path)
+        # messages.txt wasn't re-read
+        assert store.list_messages() == ["a", "b", "c"]
+
+    def test_out_of_order_file_matches_reload(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        store.add_messages(["a"])
+        path = store.save_file("early.txt", b"b\n")
+        store.load_file(path)
+        assert store.list_messages() == ["b", "a"]
+
+    def test_replaced_file_not_duplicated(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        store.load_file(store.save_file("up.txt", b"one\n"))
+        store.load_file(store.save_file("up.txt", b"two\n"))
+        assert store.list_messages() == ["two"]
+
+    def test_splice_does_not_reread_other_files(self, tmp_path: Path):
+        store = MessageStore(_make_config(tmp_path))
+        store.load_file(store.save_file("a.txt", b"a1\n"))
+        store.load_file(store.save_file("c.txt", b"c1\n"))
+        store.load_file(store.save_file("b.txt", b"b1\n"))
+        with patch.object(store, "reload") as reload, \
+                patch.object(MessageStore, "read_lines", wraps=MessageStore.read_lines) as read:
+            store.load_file(store.save_file("b.txt", b"b2\nb3\n"))
+        reload.assert_not_called()
+        assert [c.args[0].name for c in read.call_args_list] == ["b.txt"]
+        assert store.list_messages() == ["a1", "b2", "b3", "c1"]
+        fresh = MessageStore(_make_config(tmp_path))
+        assert store._source_map == fresh._source_map
+
+
+class TestStableSample:
+    def test_fresh_sample_by_default(self, tmp_path: Path):
+        (tmp_path / "persona").mkdir()
+        (tmp_path / "persona" / "msgs.txt").write_text("\n".join(f"m{i}" for i in range(100)) + "\n")
+        store = MessageStore(_make_config(tmp_path))
+        draws = {tuple(store.get_sampled_messages(10)) for _ in range(5)}
+        assert len(draws) > 1
+
+    def test_sample_rotates_after_reuse_limit(self, tmp_path: Path):
+        (tmp_path / "persona").mkdir()
+        (tmp_path / "persona" / "msgs.txt").write_text("\n".join(f"m{i}" for i in range(100)) + "\n")
+        cfg = _make_config(tmp_path)
+        cfg.llm.sample_reuse = 2
+        store = MessageStore(cfg)
+        first = store.get_sampled_messages(10)
+        assert store.get_sampled_messages(10) == first
+        with patch.object(store, "_draw_sample", return_value=["other"]) as draw:
+            assert store.get_sampled_messages(10) == ["other"]
+        draw.assert_called_once_with(10)
+
+    def test_sample_reused_until_corpus_changes(self, tmp_path: Path):
+        (tmp_path / "persona").mkdir()
+        (tmp_path / "persona" / "msgs.txt").write_text("\n".join(f"m{i}" for i in range(100)) + "\n")
+        cfg = _make_config(tmp_path)
+        cfg.llm.sample_reuse = 10
+        store = MessageStore(cfg)
+        first = store.get_sampled_messages(10)
+        assert store.get_sampled_messages(10) == first
+        store.add_messages(["new one"])
+        assert store.count == 101
+        # Corpus changed: a new sample is drawn (and cached again)
+        second = store.get_sampled_messages(10)
+        assert store.get_sampled_messages(10) == second
+
+    def test_returned_sample_is_a_copy(self, tmp_path: Path):
+        (tmp_path / "persona").mkdir()
+        (tmp_path / "persona" / "msgs.txt").write_text("a\nb\nc\n")
+        cfg = _make_config(tmp_path)
+        cfg.llm.sample_reuse = 10
+        store = MessageStore(cfg)
+        store.get_sampled_messages(2).clear()
+        assert len(store.get_sampled_messages(2)) == 2
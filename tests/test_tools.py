@@ -1,4 +1,4 @@
-"""Tests for faithful.tools — MemoryExecutor file CRUD."""
+"""Tests for faithful.tools — MemoryExecutor file CRUD and web_fetch page extraction."""
 
 from __future__ import annotations
 
@@ -134,3 +134,22 @@ class TestMemoryExecutorSecurity:
     def test_unknown_command(self, mem: MemoryExecutor):
         result = mem.execute({"command": "drop_table"})
         assert "Unknown command" in result
+
+
+class TestPageToJson:
+    def test_html_is_flattened(self):
+        import json
+
+        from faithful.tools.executor import _page_to_json
+
+        out = json.loads(_page_to_json("http://x", "<p>hello</p><p>world</p>", True))
+        assert out == {"url": "http://x", "content": "hello\nworld"}
+
+    def test_long_text_truncated(self):
+        import json
+
+        from faithful.tools.executor import MAX_FETCH_CHARS, _page_to_json
+
+        out = json.loads(_page_to_json("http://x", "a" * (MAX_FETCH_CHARS + 10), False))
+        assert out["content"].endswith("[Content truncated]")
+        assert out["content"].startswith("a" * MAX_FETCH_CHARS)